@@ -1,13 +1,22 @@
 """PyPevol - PyPI Package API Evolution Analyzer."""
 
+import importlib
+
 __version__ = "0.1.0"
 __author__ = "PyPevol Team"
 __email__ = "pypevol@example.com"
 
-from .analyzer import PackageAnalyzer
-from .models import APIElement, VersionInfo, AnalysisResult
-from .fetcher import PyPIFetcher
-from .parser import SourceParser
+# Public symbols are imported lazily (PEP 562) so that importing pypevol for
+# test collection or notebooks does not pay for the full dependency chain
+# (requests, yaml, packaging, ...) until a symbol is actually used.
+_LAZY_IMPORTS = {
+    "PackageAnalyzer": "pypevol.analyzer",
+    "APIElement": "pypevol.models",
+    "VersionInfo": "pypevol.models",
+    "AnalysisResult": "pypevol.models",
+    "PyPIFetcher": "pypevol.fetcher",
+    "SourceParser": "pypevol.parser",
+}
 
 __all__ = [
     "PackageAnalyzer",
@@ -17,3 +26,18 @@ __all__ = [
     "PyPIFetcher",
     "SourceParser",
 ]
+
+
+def __getattr__(name):
+    """Resolve public symbols on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
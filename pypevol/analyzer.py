@@ -1,6 +1,10 @@
 """Main package analyzer for PyPevol."""
 
 import logging
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Dict, Set, Tuple
 from datetime import datetime
@@ -14,6 +18,19 @@ from .parser import SourceParser
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class AnalysisIntent:
+    """Canonical, hashable description of an explicit-version analysis.
+
+    Different entry points (analyze_package with a versions list,
+    compare_versions) that describe the same semantic request normalize to the
+    same intent, so they share one cache entry.
+    """
+
+    package_name: str
+    versions: Tuple[str, ...]
+
+
 class PackageAnalyzer:
     """Main analyzer for package API evolution."""
 
@@ -24,22 +41,45 @@ class PackageAnalyzer:
         include_deprecated: bool = True,
         prefer_wheels: bool = True,
         include_yanked: bool = False,
+        api_cache_dir: Optional[Path] = None,
+        parse_bodies: bool = True,
     ):
         """Initialize the package analyzer.
 
         Args:
-            cache_dir: Directory to cache downloaded files
+            cache_dir: Directory to cache downloaded files. Defaults to
+                ~/.pypevol/cache/downloads so repeated analyses reuse
+                already-fetched archives instead of re-downloading them.
             include_private: Whether to include private APIs
             include_deprecated: Whether to include deprecated APIs
             prefer_wheels: Whether to prefer wheel files over source distributions
             include_yanked: Whether to include yanked versions in analysis
+            api_cache_dir: Directory to cache parsed API elements across runs.
+                Defaults to $PYPEVOL_CACHE or ~/.pypevol/cache/api_elements.
+            parse_bodies: Whether the parser descends into function bodies.
+                Disable for a faster API-only parse of large packages.
         """
+        if cache_dir is None:
+            env_cache = os.environ.get("PYPEVOL_CACHE")
+            base = Path(env_cache) if env_cache else Path.home() / ".pypevol" / "cache"
+            cache_dir = base / "downloads"
         self.fetcher = PyPIFetcher(cache_dir)
-        self.parser = SourceParser(include_private, include_deprecated)
+        self.parser = SourceParser(include_private, include_deprecated, parse_bodies)
         self.prefer_wheels = prefer_wheels
         self.include_yanked = include_yanked
         self.temp_dirs = []  # Track temp directories for cleanup
 
+        if api_cache_dir is None:
+            env_cache = os.environ.get("PYPEVOL_CACHE")
+            if env_cache:
+                api_cache_dir = Path(env_cache)
+            else:
+                api_cache_dir = Path.home() / ".pypevol" / "cache" / "api_elements"
+        self.api_cache_dir = Path(api_cache_dir)
+
+        # Memoized results for explicit-version analyses, keyed by intent
+        self._intent_cache: Dict[AnalysisIntent, AnalysisResult] = {}
+
     def get_package_versions(
         self, package_name: str, include_yanked: bool = False
     ) -> List[VersionInfo]:
@@ -109,6 +149,18 @@ class PackageAnalyzer:
                 "Cannot specify 'versions' parameter together with 'from_version', 'to_version', or 'max_versions'"
             )
 
+        # Explicit-version requests are memoized by canonical intent so that
+        # analyze_package and compare_versions share cache entries
+        intent = None
+        if versions is not None and from_date is None and to_date is None:
+            intent = self._resolve_intent(package_name, versions)
+            cached_result = self._intent_cache.get(intent)
+            if cached_result is not None:
+                logger.info(
+                    f"Using cached analysis for {package_name} versions {versions}"
+                )
+                return cached_result
+
         try:
             # Get version information
             if versions is not None:
@@ -140,29 +192,22 @@ class PackageAnalyzer:
 
             logger.info(f"Found {len(version_infos)} versions to analyze")
 
-            # Analyze each version
+            # Analyze each version. Versions are independent until the diff
+            # step, so fan the download/parse work out across a thread pool.
             api_elements = {}
             successful_versions = []
 
-            for version_info in version_infos:
-                logger.info(f"Analyzing version {version_info.version}")
-
-                try:
-                    elements = self._analyze_version(package_name, version_info)
-                    if elements is not None:
-                        api_elements[version_info.version] = elements
-                        successful_versions.append(version_info)
-                        logger.info(
-                            f"Found {len(elements)} API elements in version {version_info.version}"
-                        )
-                    else:
-                        logger.warning(
-                            f"Failed to analyze version {version_info.version}"
-                        )
+            element_lists = self._analyze_versions_parallel(package_name, version_infos)
 
-                except Exception as e:
-                    logger.error(f"Error analyzing version {version_info.version}: {e}")
-                    continue
+            for version_info, elements in zip(version_infos, element_lists):
+                if elements is not None:
+                    api_elements[version_info.version] = elements
+                    successful_versions.append(version_info)
+                    logger.info(
+                        f"Found {len(elements)} API elements in version {version_info.version}"
+                    )
+                else:
+                    logger.warning(f"Failed to analyze version {version_info.version}")
 
             if not successful_versions:
                 logger.error(
@@ -181,7 +226,7 @@ class PackageAnalyzer:
 
             logger.info(f"Analysis complete. Found {len(changes)} API changes.")
 
-            return AnalysisResult(
+            result = AnalysisResult(
                 package_name=package_name,
                 versions=successful_versions,
                 api_elements=api_elements,
@@ -198,6 +243,11 @@ class PackageAnalyzer:
                 },
             )
 
+            if intent is not None:
+                self._intent_cache[intent] = result
+
+            return result
+
         except Exception as e:
             logger.error(f"Analysis failed for {package_name}: {e}")
             raise
@@ -205,6 +255,88 @@ class PackageAnalyzer:
         finally:
             self._cleanup()
 
+    def compare_versions(
+        self, package_name: str, version1: str, version2: str
+    ) -> AnalysisResult:
+        """Compare the APIs of two specific versions of a package.
+
+        Results are memoized per analyzer instance, keyed on
+        (package_name, version1, version2), so repeatedly comparing the same
+        pair only pays the download and parse cost once.
+
+        Args:
+            package_name: Name of the package
+            version1: First version to compare
+            version2: Second version to compare
+
+        Returns:
+            AnalysisResult containing the two versions and their API changes
+        """
+        intent = self._resolve_intent(package_name, [version1, version2])
+        cached_result = self._intent_cache.get(intent)
+        if cached_result is not None:
+            logger.debug(
+                f"Using cached comparison for {package_name} {version1} -> {version2}"
+            )
+            return cached_result
+
+        result = self.analyze_package(package_name, versions=[version1, version2])
+        self._intent_cache[intent] = result
+        return result
+
+    def _resolve_intent(self, package_name: str, versions: List[str]) -> AnalysisIntent:
+        """Normalize an explicit-version request into a canonical intent.
+
+        Version order does not affect the result (changes are calculated in
+        chronological order), so the versions are sorted to make semantically
+        identical requests hash to the same cache key.
+
+        Args:
+            package_name: Name of the package
+            versions: Requested version strings
+
+        Returns:
+            Canonical AnalysisIntent for this request
+        """
+        return AnalysisIntent(
+            package_name=package_name, versions=tuple(sorted(versions))
+        )
+
+    def clear_cache(self):
+        """Clear memoized analysis results."""
+        self._intent_cache.clear()
+
+    def _analyze_versions_parallel(
+        self, package_name: str, version_infos: List[VersionInfo]
+    ) -> List[Optional[List[APIElement]]]:
+        """Analyze several versions concurrently.
+
+        Each version's download/extract/parse is independent, so the work is
+        dispatched to a thread pool; the cheap pairwise diff stays sequential.
+
+        Args:
+            package_name: Name of the package
+            version_infos: Versions to analyze
+
+        Returns:
+            Per-version element lists in input order (None for failures)
+        """
+
+        def analyze_one(version_info: VersionInfo) -> Optional[List[APIElement]]:
+            logger.info(f"Analyzing version {version_info.version}")
+            try:
+                return self._analyze_version(package_name, version_info)
+            except Exception as e:
+                logger.error(f"Error analyzing version {version_info.version}: {e}")
+                return None
+
+        if len(version_infos) <= 1:
+            return [analyze_one(v) for v in version_infos]
+
+        max_workers = min(len(version_infos), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(analyze_one, version_infos))
+
     def _filter_versions_by_date(
         self,
         version_infos: List[VersionInfo],
@@ -259,6 +391,14 @@ class PackageAnalyzer:
         Returns:
             List of API elements or None if analysis failed
         """
+        # Check the persistent cache before doing any network or parse work
+        cached_elements = self._load_cached_elements(package_name, version_info)
+        if cached_elements is not None:
+            logger.info(
+                f"Using cached API elements for {package_name} {version_info.version}"
+            )
+            return cached_elements
+
         try:
             # Download and extract the package
             result = self.fetcher.download_and_extract_version(
@@ -282,12 +422,96 @@ class PackageAnalyzer:
             # Parse the package
             api_elements = self.parser.parse_package(package_dir, package_name)
 
+            self._store_cached_elements(package_name, version_info, api_elements)
+
             return api_elements
 
         except Exception as e:
             logger.error(f"Failed to analyze version {version_info.version}: {e}")
             return None
 
+    def _distribution_digest(self, version_info: VersionInfo) -> Optional[str]:
+        """Get the SHA-256 digest of the distribution that would be analyzed.
+
+        PyPI publishes per-file digests in the release metadata, so no local
+        hashing is needed. The digest of the preferred artifact is used so the
+        cache keys on file content rather than the (re-uploadable) version
+        string.
+
+        Args:
+            version_info: Version information
+
+        Returns:
+            SHA-256 hex digest or None if unavailable
+        """
+        digests = (version_info.metadata or {}).get("sha256", {})
+        if self.prefer_wheels and digests.get("bdist_wheel"):
+            return digests["bdist_wheel"]
+        return digests.get("sdist") or digests.get("bdist_wheel")
+
+    def _api_cache_path(self, package_name: str, version_info: VersionInfo) -> Path:
+        """Get the cache file path for a package version's API elements.
+
+        Args:
+            package_name: Name of the package
+            version_info: Version information
+
+        Returns:
+            Path to the cache file
+        """
+        digest = self._distribution_digest(version_info)
+        if digest:
+            return (
+                self.api_cache_dir
+                / f"{package_name}-{version_info.version}-{digest[:16]}.pkl"
+            )
+        return self.api_cache_dir / f"{package_name}-{version_info.version}.pkl"
+
+    def _load_cached_elements(
+        self, package_name: str, version_info: VersionInfo
+    ) -> Optional[List[APIElement]]:
+        """Load cached API elements for a package version.
+
+        Args:
+            package_name: Name of the package
+            version_info: Version information
+
+        Returns:
+            Cached list of API elements or None on cache miss
+        """
+        cache_path = self._api_cache_path(package_name, version_info)
+        if not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load API cache from {cache_path}: {e}")
+            return None
+
+    def _store_cached_elements(
+        self,
+        package_name: str,
+        version_info: VersionInfo,
+        api_elements: List[APIElement],
+    ) -> None:
+        """Store API elements for a package version in the persistent cache.
+
+        Args:
+            package_name: Name of the package
+            version_info: Version information
+            api_elements: Parsed API elements to cache
+        """
+        cache_path = self._api_cache_path(package_name, version_info)
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(api_elements, f)
+        except Exception as e:
+            logger.warning(f"Failed to write API cache to {cache_path}: {e}")
+
     def _find_package_directory(
         self, extracted_path: Path, package_name: str
     ) -> Optional[Path]:
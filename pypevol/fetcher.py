@@ -3,10 +3,14 @@
 import requests
 import json
 import tempfile
+import time
 import zipfile
 import tarfile
 import os
 import shutil
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from urllib.parse import urlparse
@@ -15,12 +19,116 @@ import logging
 
 from .models import VersionInfo
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _parse_version(version: str):
+    """Parse a version string to a packaging Version, memoized.
+
+    The same version strings are parsed repeatedly across range queries,
+    sorting and model construction; caching turns the regex-heavy parse into
+    a dict lookup after the first sighting.
+    """
+    from packaging.version import Version
+
+    return Version(version)
+
+
+def _parse_upload_time(upload_time: Optional[str]) -> Optional[datetime]:
+    """Parse a PyPI upload timestamp, or None if missing or unparseable.
+
+    datetime.fromisoformat covers both upload_time_iso_8601 (after mapping
+    the Z suffix) and the legacy space-separated upload_time on a C fast
+    path; dateutil only handles whatever is left.
+    """
+    if not upload_time:
+        return None
+
+    try:
+        if upload_time.endswith("Z"):
+            return datetime.fromisoformat(upload_time.replace("Z", "+00:00"))
+        return datetime.fromisoformat(upload_time)
+    except ValueError:
+        pass
+
+    try:
+        from dateutil.parser import parse as parse_date
+
+        return parse_date(upload_time)
+    except (ValueError, ImportError):
+        return None
+
+
+def _parse_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    PyPI metadata blobs for popular packages run to several MB; orjson parses
+    them a few times faster than the stdlib decoder behind response.json().
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class PyPIFetcher:
     """Fetches package information and files from PyPI."""
 
+    # How long cached version lists stay fresh, in seconds. Override with the
+    # PYPEVOL_VERSIONS_TTL environment variable.
+    VERSIONS_CACHE_TTL = 3600
+
+    # How long cached package metadata blobs stay fresh, in seconds. Override
+    # with the PYPEVOL_METADATA_TTL environment variable.
+    METADATA_CACHE_TTL = 3600
+
+    # Process-wide session shared by all fetcher instances; see _shared_session
+    _session: Optional[requests.Session] = None
+
+    @classmethod
+    def _shared_session(cls) -> requests.Session:
+        """Return the session shared by every fetcher in this process.
+
+        Creating a session per fetcher means a fresh TLS handshake to pypi.org
+        for each instance; sharing one keeps the pooled connections warm across
+        fetchers and across analyzer runs in the same process.
+        """
+        if cls._session is None:
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "User-Agent": "pypevol-plus/0.1.0 (package-evolution-analyzer)",
+                    "Accept": "application/json",
+                }
+            )
+            # requests already advertises gzip/deflate (and brotli when a
+            # brotli decoder is installed), so compressed transfer needs no
+            # explicit Accept-Encoding here; forcing "br" without a decoder
+            # would break response decoding.
+
+            # Size the connection pool to match the parallel fan-outs; urllib3
+            # defaults to 10 pooled connections and discards the rest, which
+            # forces reconnects when more workers hit pypi.org at once. Retry
+            # transient CDN errors with backoff instead of failing the fetch.
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=requests.adapters.Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            cls._session = session
+        return cls._session
+
     def __init__(self, cache_dir: Optional[Path] = None):
         """Initialize the PyPI fetcher.
 
@@ -28,10 +136,7 @@ class PyPIFetcher:
             cache_dir: Directory to cache downloaded files. If None, uses temp directory.
         """
         self.base_url = "https://pypi.org/pypi"
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"User-Agent": "pypevol-plus/0.1.0 (package-evolution-analyzer)"}
-        )
+        self.session = self._shared_session()
 
         if cache_dir:
             self.cache_dir = Path(cache_dir)
@@ -39,6 +144,18 @@ class PyPIFetcher:
         else:
             self.cache_dir = None
 
+        # In-memory cache of per-version metadata, keyed by (package, version)
+        self._version_metadata_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        # In-memory cache of the aggregate package metadata, keyed by package
+        self._metadata_cache: Dict[str, Dict[str, Any]] = {}
+
+        # PEP 440-ordered version index per package: (names, parsed keys)
+        self._sorted_versions: Dict[str, Tuple[List[str], List[Any]]] = {}
+
+        # Per-package yanked flags, computed once from the metadata blob
+        self._yanked_index: Dict[str, Dict[str, bool]] = {}
+
     def _is_version_yanked(self, version_data: List[Dict]) -> bool:
         """Check if a version is yanked by examining its files.
 
@@ -57,11 +174,42 @@ class PyPIFetcher:
 
         return False
 
-    def get_package_metadata(self, package_name: str) -> Dict[str, Any]:
+    def _get_yanked_index(self, package_name: str) -> Dict[str, bool]:
+        """Get the version -> yanked flag map for a package.
+
+        The per-file scan over every release is done once per package and
+        memoized, so repeated yanked checks across full version listings are
+        single dict lookups instead of nested scans.
+
+        Args:
+            package_name: Name of the package
+
+        Returns:
+            Dictionary mapping version strings to whether they are yanked
+        """
+        index = self._yanked_index.get(package_name)
+        if index is None:
+            releases = self.get_package_metadata(package_name).get("releases", {})
+            index = {
+                version: self._is_version_yanked(version_data)
+                for version, version_data in releases.items()
+            }
+            self._yanked_index[package_name] = index
+        return index
+
+    def get_package_metadata(
+        self, package_name: str, use_cache: bool = True
+    ) -> Dict[str, Any]:
         """Get package metadata from PyPI.
 
+        The aggregate metadata (which includes every release) is fetched once
+        per package and memoized; it is also cached on disk with a short TTL
+        (see METADATA_CACHE_TTL), so warm re-runs in a fresh process skip the
+        network entirely.
+
         Args:
             package_name: Name of the package
+            use_cache: Whether to reuse previously fetched metadata
 
         Returns:
             Package metadata dictionary
@@ -69,17 +217,146 @@ class PyPIFetcher:
         Raises:
             requests.RequestException: If the request fails
         """
+        if use_cache:
+            if package_name in self._metadata_cache:
+                return self._metadata_cache[package_name]
+
+            cached = self._load_cached_metadata(package_name)
+            if cached is not None:
+                self._metadata_cache[package_name] = cached
+                return cached
+
         url = f"{self.base_url}/{package_name}/json"
         logger.info(f"Fetching metadata for package: {package_name}")
 
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            metadata = _parse_json_response(response)
+            self._metadata_cache[package_name] = metadata
+            self._store_cached_metadata(package_name, metadata)
+            return metadata
         except requests.RequestException as e:
             logger.error(f"Failed to fetch metadata for {package_name}: {e}")
             raise
 
+    def get_packages_metadata(
+        self, package_names: List[str], max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch aggregate metadata for several packages concurrently.
+
+        Like fetch_versions_parallel, the per-package requests are network
+        bound, so fanning them out over the shared session costs roughly one
+        round-trip for the whole batch instead of one per package.
+
+        Args:
+            package_names: Names of the packages to fetch
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dictionary mapping package name to its metadata (failed fetches
+            omitted)
+        """
+
+        def fetch(name: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.get_package_metadata(name)
+            except requests.RequestException:
+                return None
+
+        results = {}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, max(len(package_names), 1))
+        ) as executor:
+            metadata_list = executor.map(fetch, package_names)
+            for name, metadata in zip(package_names, metadata_list):
+                if metadata is not None:
+                    results[name] = metadata
+
+        return results
+
+    def get_all_releases(self, package_name: str) -> Dict[str, List[Dict]]:
+        """Get the release index (version -> file infos) for a package.
+
+        Args:
+            package_name: Name of the package
+
+        Returns:
+            Dictionary mapping version strings to their release file information
+        """
+        metadata = self.get_package_metadata(package_name)
+        return metadata.get("releases", {})
+
+    def get_version_metadata(
+        self, package_name: str, version: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get metadata for a single version, using the in-memory cache if warm.
+
+        Args:
+            package_name: Name of the package
+            version: Version string
+
+        Returns:
+            Version metadata dictionary or None if the request fails
+        """
+        cache_key = (package_name, version)
+        if cache_key in self._version_metadata_cache:
+            return self._version_metadata_cache[cache_key]
+
+        url = f"{self.base_url}/{package_name}/{version}/json"
+        try:
+            response = self.session.get(url)
+            response.raise_for_status()
+            metadata = _parse_json_response(response)
+            self._version_metadata_cache[cache_key] = metadata
+            return metadata
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch metadata for {package_name} {version}: {e}")
+            return None
+
+    def fetch_versions_parallel(
+        self, package_name: str, versions: List[str], max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fetch per-version metadata for several versions concurrently.
+
+        The requests are network-bound, so issuing them from a thread pool over
+        the shared session drops wall time from one round-trip per version to
+        roughly a single round-trip for the whole batch.
+
+        Args:
+            package_name: Name of the package
+            versions: Version strings to fetch metadata for
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dictionary mapping version to its metadata (failed fetches omitted)
+        """
+        results = {}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, max(len(versions), 1))
+        ) as executor:
+            metadata_list = executor.map(
+                lambda version: self.get_version_metadata(package_name, version),
+                versions,
+            )
+            for version, metadata in zip(versions, metadata_list):
+                if metadata is not None:
+                    results[version] = metadata
+
+        return results
+
+    def prefetch_versions(self, package_name: str, versions: List[str]) -> None:
+        """Warm the in-memory metadata cache for the given versions.
+
+        Call this before analyzing a known list of versions so downstream
+        per-version lookups read from the cache instead of hitting PyPI.
+
+        Args:
+            package_name: Name of the package
+            versions: Version strings to prefetch
+        """
+        self.fetch_versions_parallel(package_name, versions)
+
     def get_version_info(
         self, package_name: str, version: str, include_yanked: bool = False
     ) -> Optional[VersionInfo]:
@@ -108,7 +385,7 @@ class PyPIFetcher:
                 return None
 
             # Determine if version is yanked and get yanked reason
-            is_yanked = self._is_version_yanked(version_data)
+            is_yanked = self._get_yanked_index(package_name).get(version, False)
             yanked_reason = None
             if is_yanked:
                 # Find the yanked reason from any of the files
@@ -128,40 +405,31 @@ class PyPIFetcher:
             # Parse release date from the first file
             release_date = None
             if version_data:
-                # Try different timestamp formats used by PyPI
                 upload_time = version_data[0].get(
                     "upload_time_iso_8601"
                 ) or version_data[0].get("upload_time")
-                if upload_time:
-                    try:
-                        if "T" in upload_time and upload_time.endswith("Z"):
-                            # ISO format with Z suffix
-                            release_date = datetime.fromisoformat(
-                                upload_time.replace("Z", "+00:00")
-                            )
-                        elif "T" in upload_time:
-                            # ISO format without Z suffix
-                            release_date = datetime.fromisoformat(upload_time)
-                        else:
-                            # Try parsing as general datetime format
-                            from dateutil.parser import parse as parse_date
-
-                            release_date = parse_date(upload_time)
-                    except (ValueError, ImportError) as e:
-                        logger.warning(
-                            f"Could not parse upload_time '{upload_time}' for {package_name} {version}: {e}"
-                        )
-                        release_date = None
-
-            # Find wheel and source URLs
+                release_date = _parse_upload_time(upload_time)
+                if upload_time and release_date is None:
+                    logger.warning(
+                        f"Could not parse upload_time '{upload_time}' for {package_name} {version}"
+                    )
+
+            # Find wheel and source URLs, keeping the published SHA-256
+            # digests so downstream caches can key on file content
             wheel_url = None
             source_url = None
+            sha256_digests = {}
 
             for file_info in version_data:
+                digest = file_info.get("digests", {}).get("sha256")
                 if file_info["packagetype"] == "bdist_wheel":
                     wheel_url = file_info["url"]
+                    if digest:
+                        sha256_digests["bdist_wheel"] = digest
                 elif file_info["packagetype"] == "sdist":
                     source_url = file_info["url"]
+                    if digest:
+                        sha256_digests["sdist"] = digest
 
             # Get package info for this version
             package_info = metadata.get("info", {})
@@ -176,6 +444,7 @@ class PyPIFetcher:
                 yanked=is_yanked,
                 yanked_reason=yanked_reason,
                 metadata={
+                    "sha256": sha256_digests,
                     "summary": package_info.get("summary"),
                     "description": package_info.get("description"),
                     "author": package_info.get("author"),
@@ -204,8 +473,7 @@ class PyPIFetcher:
             List of VersionInfo objects sorted by release date
         """
         try:
-            metadata = self.get_package_metadata(package_name)
-            releases = metadata.get("releases", {})
+            releases = self.get_all_releases(package_name)
 
             versions = []
             for version in releases.keys():
@@ -332,15 +600,7 @@ class PyPIFetcher:
         if not version_info:
             return None
 
-        # Choose which file to download
-        download_url = None
-        if prefer_wheel and version_info.wheel_url:
-            download_url = version_info.wheel_url
-        elif version_info.source_url:
-            download_url = version_info.source_url
-        elif version_info.wheel_url:
-            download_url = version_info.wheel_url
-
+        download_url = self._select_download_url(version_info, prefer_wheel)
         if not download_url:
             logger.warning(f"No downloadable files found for {package_name} {version}")
             return None
@@ -360,28 +620,198 @@ class PyPIFetcher:
             )
             return None
 
+    def _select_download_url(
+        self, version_info: VersionInfo, prefer_wheel: bool = True
+    ) -> Optional[str]:
+        """Choose which distribution file to download for a version.
+
+        Args:
+            version_info: Version information
+            prefer_wheel: Whether to prefer wheel over source distribution
+
+        Returns:
+            Download URL or None if the version has no downloadable files
+        """
+        if prefer_wheel and version_info.wheel_url:
+            return version_info.wheel_url
+        if version_info.source_url:
+            return version_info.source_url
+        return version_info.wheel_url
+
+    def download_versions(
+        self,
+        package_name: str,
+        versions: List[str],
+        prefer_wheel: bool = True,
+        max_workers: int = 8,
+    ) -> Dict[str, Path]:
+        """Download distribution files for several versions concurrently.
+
+        Downloads are network-bound, so fetching them from a thread pool makes
+        the wall time of the batch roughly the slowest single download instead
+        of the sum of all of them.
+
+        Args:
+            package_name: Name of the package
+            versions: Versions to download
+            prefer_wheel: Whether to prefer wheels over source distributions
+            max_workers: Maximum number of concurrent downloads
+
+        Returns:
+            Dictionary mapping version to downloaded file path
+            (failed downloads omitted)
+        """
+
+        def download_one(version: str) -> Optional[Path]:
+            version_info = self.get_version_info(package_name, version)
+            if not version_info:
+                return None
+
+            download_url = self._select_download_url(version_info, prefer_wheel)
+            if not download_url:
+                logger.warning(
+                    f"No downloadable files found for {package_name} {version}"
+                )
+                return None
+
+            try:
+                return self.download_file(download_url)
+            except requests.RequestException:
+                return None
+
+        results = {}
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, max(len(versions), 1))
+        ) as executor:
+            for version, file_path in zip(
+                versions, executor.map(download_one, versions)
+            ):
+                if file_path is not None:
+                    results[version] = file_path
+
+        return results
+
+    @staticmethod
+    def _cache_root() -> Path:
+        """Get the root directory for on-disk caches.
+
+        Honors the PYPEVOL_CACHE environment variable, falling back to
+        ~/.pypevol/cache (the same root the analyzer uses for downloads).
+        """
+        env_cache = os.environ.get("PYPEVOL_CACHE")
+        return Path(env_cache) if env_cache else Path.home() / ".pypevol" / "cache"
+
+    def _versions_cache_path(self, package_name: str, include_yanked: bool) -> Path:
+        """Get the disk cache file path for a package's version list."""
+        suffix = "-yanked" if include_yanked else ""
+        return self._cache_root() / "versions" / f"{package_name}{suffix}.json"
+
+    def _metadata_cache_path(self, package_name: str) -> Path:
+        """Get the disk cache file path for a package's metadata blob."""
+        return self._cache_root() / "metadata" / f"{package_name}.json"
+
+    def _load_cached_metadata(self, package_name: str) -> Optional[Dict[str, Any]]:
+        """Load a fresh cached metadata blob from disk, or None if stale/missing.
+
+        Freshness is judged by the file's mtime so the multi-megabyte blob is
+        stored verbatim (no timestamp wrapper) and decodes on the orjson fast
+        path when it is installed.
+        """
+        cache_path = self._metadata_cache_path(package_name)
+        if not cache_path.exists():
+            return None
+
+        try:
+            ttl = int(os.environ.get("PYPEVOL_METADATA_TTL", self.METADATA_CACHE_TTL))
+            if time.time() - cache_path.stat().st_mtime >= ttl:
+                return None
+            with open(cache_path, "rb") as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except Exception as e:
+            logger.warning(f"Failed to read metadata cache {cache_path}: {e}")
+
+        return None
+
+    def _store_cached_metadata(
+        self, package_name: str, metadata: Dict[str, Any]
+    ) -> None:
+        """Store a metadata blob in the disk cache."""
+        cache_path = self._metadata_cache_path(package_name)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                payload = orjson.dumps(metadata)
+            else:
+                payload = json.dumps(metadata).encode("utf-8")
+            with open(cache_path, "wb") as f:
+                f.write(payload)
+        except Exception as e:
+            logger.warning(f"Failed to write metadata cache {cache_path}: {e}")
+
+    def _load_cached_versions(
+        self, package_name: str, include_yanked: bool
+    ) -> Optional[List[str]]:
+        """Load a fresh cached version list from disk, or None if stale/missing."""
+        cache_path = self._versions_cache_path(package_name, include_yanked)
+        if not cache_path.exists():
+            return None
+
+        try:
+            ttl = int(os.environ.get("PYPEVOL_VERSIONS_TTL", self.VERSIONS_CACHE_TTL))
+            with open(cache_path, "r") as f:
+                cached = json.load(f)
+            if time.time() - cached.get("timestamp", 0) < ttl:
+                return cached.get("versions")
+        except Exception as e:
+            logger.warning(f"Failed to read version cache {cache_path}: {e}")
+
+        return None
+
+    def _store_cached_versions(
+        self, package_name: str, include_yanked: bool, versions: List[str]
+    ) -> None:
+        """Store a version list in the disk cache."""
+        cache_path = self._versions_cache_path(package_name, include_yanked)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "w") as f:
+                json.dump({"timestamp": time.time(), "versions": versions}, f)
+        except Exception as e:
+            logger.warning(f"Failed to write version cache {cache_path}: {e}")
+
     def get_package_versions(
-        self, package_name: str, include_yanked: bool = False
+        self, package_name: str, include_yanked: bool = False, refresh: bool = False
     ) -> List[str]:
         """Get a list of all version names for a package without parsing VersionInfo.
 
+        Version lists change rarely, so they are cached on disk with a short
+        TTL (see VERSIONS_CACHE_TTL); repeat calls within the TTL skip the
+        network entirely.
+
         Args:
             package_name: Name of the package
             include_yanked: Whether to include yanked versions
+            refresh: Whether to bypass the disk cache and re-fetch from PyPI
 
         Returns:
             List of version strings sorted chronologically (oldest first)
         """
+        if not refresh:
+            cached_versions = self._load_cached_versions(package_name, include_yanked)
+            if cached_versions is not None:
+                return cached_versions
+
         try:
-            metadata = self.get_package_metadata(package_name)
-            releases = metadata.get("releases", {})
+            releases = self.get_all_releases(package_name)
 
             # Filter out versions without release data and optionally yanked versions
+            yanked_index = self._get_yanked_index(package_name)
             valid_versions = []
             for version, version_data in releases.items():
                 if version_data:  # Only include versions with actual release data
                     # Check if version is yanked
-                    if not include_yanked and self._is_version_yanked(version_data):
+                    if not include_yanked and yanked_index.get(version, False):
                         logger.debug(
                             f"Skipping yanked version {version} for package {package_name}"
                         )
@@ -390,34 +820,98 @@ class PyPIFetcher:
 
             # Sort versions chronologically by trying to parse release dates
             def get_sort_key(version):
-                try:
-                    version_data = releases[version]
-                    if version_data:
-                        upload_time = version_data[0].get(
-                            "upload_time_iso_8601"
-                        ) or version_data[0].get("upload_time")
-                        if upload_time:
-                            if "T" in upload_time and upload_time.endswith("Z"):
-                                return datetime.fromisoformat(
-                                    upload_time.replace("Z", "+00:00")
-                                )
-                            elif "T" in upload_time:
-                                return datetime.fromisoformat(upload_time)
-                            else:
-                                from dateutil.parser import parse as parse_date
-
-                                return parse_date(upload_time)
-                except Exception:
-                    pass
+                version_data = releases.get(version)
+                if version_data:
+                    upload_time = version_data[0].get(
+                        "upload_time_iso_8601"
+                    ) or version_data[0].get("upload_time")
+                    parsed = _parse_upload_time(upload_time)
+                    if parsed is not None:
+                        return parsed
                 return datetime.min
 
             valid_versions.sort(key=get_sort_key)
+            self._store_cached_versions(package_name, include_yanked, valid_versions)
             return valid_versions
 
         except Exception as e:
             logger.error(f"Failed to get version list for {package_name}: {e}")
             return []
 
+    def _get_sorted_versions(self, package_name: str) -> Tuple[List[str], List[Any]]:
+        """Get the PEP 440-ordered version index for a package.
+
+        The sort is done once per package and cached, so range queries avoid
+        re-parsing and re-sorting version strings on every call.
+
+        Args:
+            package_name: Name of the package
+
+        Returns:
+            Tuple of (version strings, parsed Version keys), both in ascending
+            PEP 440 order; unparseable versions are skipped
+        """
+        cached = self._sorted_versions.get(package_name)
+        if cached is not None:
+            return cached
+
+        from packaging.version import InvalidVersion
+
+        pairs = []
+        for version in self.get_all_releases(package_name):
+            try:
+                pairs.append((_parse_version(version), version))
+            except InvalidVersion:
+                continue
+
+        pairs.sort(key=lambda pair: pair[0])
+        index = ([name for _, name in pairs], [key for key, _ in pairs])
+        self._sorted_versions[package_name] = index
+        return index
+
+    def version_range(
+        self,
+        package_name: str,
+        from_version: Optional[str] = None,
+        to_version: Optional[str] = None,
+    ) -> List[str]:
+        """Get the version strings within an inclusive PEP 440 range.
+
+        Uses binary search over the cached sorted index instead of parsing and
+        comparing every version per call.
+
+        Args:
+            package_name: Name of the package
+            from_version: Lower bound (inclusive), or None for no lower bound
+            to_version: Upper bound (inclusive), or None for no upper bound
+
+        Returns:
+            Version strings in ascending PEP 440 order within the range
+        """
+        names, keys = self._get_sorted_versions(package_name)
+        lo = bisect_left(keys, _parse_version(from_version)) if from_version else 0
+        hi = bisect_right(keys, _parse_version(to_version)) if to_version else len(keys)
+        return names[lo:hi]
+
+    def get_latest_versions(self, package_name: str, n: int = 1) -> List[str]:
+        """Get the n most recent version strings in PEP 440 order, latest first.
+
+        Slices the cached sorted index instead of sorting (or heap-selecting)
+        per call, so repeated lookups cost no version parsing or comparisons.
+
+        Args:
+            package_name: Name of the package
+            n: Number of versions to return
+
+        Returns:
+            Up to n version strings in descending PEP 440 order
+        """
+        if n <= 0:
+            return []
+
+        names, _ = self._get_sorted_versions(package_name)
+        return names[-n:][::-1]
+
     def get_specific_versions(
         self, package_name: str, versions: List[str], include_yanked: bool = False
     ) -> List[VersionInfo]:
@@ -480,26 +974,17 @@ class PyPIFetcher:
         if not all_versions:
             return []
 
-        # Filter by version range
+        # Filter by version range using the cached sorted index
         if from_version or to_version:
-            from packaging.version import parse as parse_version
-
-            filtered_versions = []
-            for version_info in all_versions:
-                try:
-                    v = parse_version(version_info.version)
-
-                    if from_version and v < parse_version(from_version):
-                        continue
-                    if to_version and v > parse_version(to_version):
-                        continue
-
-                    filtered_versions.append(version_info)
-                except Exception:
-                    # Skip versions that can't be parsed
-                    continue
+            try:
+                allowed = set(
+                    self.version_range(package_name, from_version, to_version)
+                )
+            except Exception:
+                # Unparseable range bounds match nothing
+                allowed = set()
 
-            all_versions = filtered_versions
+            all_versions = [v for v in all_versions if v.version in allowed]
 
         # Limit number of versions
         if max_versions and len(all_versions) > max_versions:
@@ -1,11 +1,54 @@
 """Data models for PyPevol."""
 
+import re
+import sys
+import warnings
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Any, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Any, Tuple, Union
 from enum import Enum
 from datetime import datetime
 import json
 
+from packaging.version import InvalidVersion, Version
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Matches the date formats produced by PyPI and by our own serialization:
+# a date, optionally followed by a time with optional fraction and offset
+_DATE_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)?$"
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> Optional[datetime]:
+    """Parse a release-date string into a datetime, or None if unparseable.
+
+    datetime.fromisoformat covers the common case on a C fast path; the
+    compiled regex handles the remaining known formats without the cost of an
+    exception-driven fallback chain. Results are cached since the same date
+    strings recur across packages and versions.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+
+    match = _DATE_RE.match(value)
+    if match:
+        try:
+            return datetime(*(int(part) for part in match.groups(default="0")))
+        except ValueError:
+            return None
+
+    return None
+
 
 class APIType(Enum):
     """Types of API elements that can be tracked."""
@@ -27,7 +70,7 @@ class ChangeType(Enum):
     DEPRECATED = "deprecated"
 
 
-@dataclass
+@dataclass(slots=True)
 class APIElement:
     """Represents an API element (function, class, method, etc.)."""
 
@@ -42,16 +85,66 @@ class APIElement:
     type_hints: Dict[str, str] = field(default_factory=dict)
     decorators: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _full_name: str = field(default="", init=False, repr=False, compare=False)
+    _signature_key: str = field(default="", init=False, repr=False, compare=False)
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Post-initialization processing."""
+        # Intern the heavily repeated identifier strings: the same module
+        # paths and names recur across thousands of elements and versions,
+        # so interning collapses duplicates and makes == a pointer check
+        self.name = sys.intern(self.name)
+        self.module_path = sys.intern(self.module_path)
+
         if self.name.startswith("_") and not self.name.startswith("__"):
             self.is_private = True
 
+        # Precompute the derived identifiers used in hot comparison loops so
+        # they are formatted once per element, not once per access
+        self._full_name = f"{self.module_path}.{self.name}"
+        if self.signature and self.signature.strip():
+            self._signature_key = f"{self._full_name}:{self.signature}"
+        else:
+            self._signature_key = f"{self._full_name}:{self.type.value}"
+
+    @classmethod
+    def _from_trusted_dict(cls, data: Dict[str, Any]) -> "APIElement":
+        """Fast path for rebuilding an element from our own to_dict output.
+
+        Bypasses the dataclass __init__ and fills the slots directly; the
+        derived fields are recomputed inline. Only safe for payloads this
+        class serialized itself.
+        """
+        obj = object.__new__(cls)
+        obj.name = name = sys.intern(data["name"])
+        api_type = APIType._value2member_map_.get(data["type"], data["type"])
+        obj.type = api_type
+        obj.module_path = module_path = sys.intern(data["module_path"])
+        obj.signature = signature = data.get("signature")
+        obj.docstring = data.get("docstring")
+        obj.line_number = data.get("line_number")
+        obj.is_private = data.get("is_private", False) or (
+            name.startswith("_") and not name.startswith("__")
+        )
+        obj.is_deprecated = data.get("is_deprecated", False)
+        obj.type_hints = data.get("type_hints", {})
+        obj.decorators = data.get("decorators", [])
+        obj.metadata = data.get("metadata", {})
+        obj._full_name = full_name = f"{module_path}.{name}"
+        if signature and signature.strip():
+            obj._signature_key = f"{full_name}:{signature}"
+        else:
+            obj._signature_key = f"{full_name}:{api_type.value}"
+        obj._cached_dict = None
+        return obj
+
     @property
     def full_name(self) -> str:
         """Get the fully qualified name of the API element."""
-        return f"{self.module_path}.{self.name}"
+        return self._full_name
 
     @property
     def module(self) -> str:
@@ -68,20 +161,17 @@ class APIElement:
         Returns:
             str: A unique signature string for this API element
         """
-        try:
-            # Use the method signature if available for more precision
-            if self.signature and self.signature.strip():
-                return f"{self.full_name}:{self.signature}"
-            else:
-                # Fall back to a combination of full name and type
-                return f"{self.full_name}:{self.type.value}"
-        except Exception as e:
-            # Robust fallback in case of any errors
-            return f"{self.module_path}.{self.name}:{getattr(self.type, 'value', str(self.type))}"
+        return self._signature_key
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
-        return {
+        """Convert to dictionary representation.
+
+        Elements are not mutated after construction, so the dict is built once
+        and reused on subsequent calls.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+        self._cached_dict = {
             "name": self.name,
             "type": self.type.value,
             "module_path": self.module_path,
@@ -95,9 +185,10 @@ class APIElement:
             "metadata": self.metadata,
             "full_name": self.full_name,
         }
+        return self._cached_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionInfo:
     """Information about a specific package version."""
 
@@ -110,30 +201,34 @@ class VersionInfo:
     yanked: bool = False
     yanked_reason: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _parsed_version: Optional[Version] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Post-initialization processing."""
+        # Version strings are shared across elements, changes and caches
+        self.version = sys.intern(self.version)
+
+        # Parse the version string once so ordering code does not re-parse it
+        try:
+            self._parsed_version = Version(self.version)
+        except InvalidVersion:
+            self._parsed_version = None
+
         # Convert string dates to datetime objects
         if isinstance(self.release_date, str):
-            try:
-                # Try to parse ISO format first
-                self.release_date = datetime.fromisoformat(self.release_date)
-            except (ValueError, AttributeError):
-                try:
-                    # Try common date format
-                    self.release_date = datetime.strptime(self.release_date, "%Y-%m-%d")
-                except ValueError:
-                    try:
-                        # Try another common format
-                        self.release_date = datetime.strptime(
-                            self.release_date, "%Y-%m-%d %H:%M:%S"
-                        )
-                    except ValueError:
-                        # If all parsing fails, set to None and warn
-                        print(
-                            f"Warning: Could not parse date '{self.release_date}', setting to None"
-                        )
-                        self.release_date = None
+            parsed_date = _parse_date_string(self.release_date)
+            if parsed_date is None:
+                warnings.warn(
+                    f"Could not parse date '{self.release_date}', setting to None",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+            self.release_date = parsed_date
 
     @property
     def number(self) -> str:
@@ -141,7 +236,14 @@ class VersionInfo:
         return self.version
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
+        """Convert to dictionary representation.
+
+        Version records are not mutated after construction, so the dict is
+        built once and reused on subsequent calls.
+        """
+        if self._cached_dict is not None:
+            return self._cached_dict
+
         # Handle release_date conversion robustly
         release_date_str = None
         if self.release_date:
@@ -152,7 +254,7 @@ class VersionInfo:
             else:
                 release_date_str = str(self.release_date)
 
-        return {
+        self._cached_dict = {
             "version": self.version,
             "release_date": release_date_str,
             "python_requires": self.python_requires,
@@ -163,9 +265,10 @@ class VersionInfo:
             "yanked_reason": self.yanked_reason,
             "metadata": self.metadata,
         }
+        return self._cached_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class APIChange:
     """Represents a change to an API element between versions."""
 
@@ -177,6 +280,9 @@ class APIChange:
     new_signature: Optional[str] = None
     description: Optional[str] = None
     is_backwards_compatible: bool = True
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def api_name(self) -> str:
@@ -188,9 +294,41 @@ class APIChange:
         """Get the version where this change occurred (alias for to_version)."""
         return self.to_version or self.from_version or "unknown"
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
-        return {
+    def to_dict(self, compact: bool = False) -> Dict[str, Any]:
+        """Convert to dictionary representation.
+
+        Changes are not mutated after construction, so the full dict is built
+        once and reused on subsequent calls. With ``compact=True`` the element
+        is emitted as an ``element_ref`` signature key plus a minimal identity
+        dict instead of the full nested dict; the caller is responsible for
+        serializing the complete element elsewhere (see AnalysisResult.to_dict).
+        """
+        if compact:
+            element = self.element
+            return {
+                "element_ref": element._signature_key,
+                # Minimal identity fields so dict consumers such as the
+                # report generators keep working without resolving the ref
+                "element": {
+                    "name": element.name,
+                    "full_name": element._full_name,
+                    "type": element.type.value,
+                    "module_path": element.module_path,
+                },
+                "change_type": self.change_type.value,
+                "from_version": self.from_version,
+                "to_version": self.to_version,
+                "old_signature": self.old_signature,
+                "new_signature": self.new_signature,
+                "description": self.description,
+                "is_backwards_compatible": self.is_backwards_compatible,
+                "api_name": self.api_name,
+                "version": self.version,
+            }
+
+        if self._cached_dict is not None:
+            return self._cached_dict
+        self._cached_dict = {
             "element": self.element.to_dict(),
             "change_type": self.change_type.value,
             "from_version": self.from_version,
@@ -202,9 +340,10 @@ class APIChange:
             "api_name": self.api_name,
             "version": self.version,
         }
+        return self._cached_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Results of analyzing a package's API evolution."""
 
@@ -214,6 +353,58 @@ class AnalysisResult:
     changes: List[APIChange]
     analysis_date: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _change_counts: Optional[Dict[ChangeType, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _changes_by_pair: Optional[
+        Dict[Tuple[Optional[str], Optional[str]], List[APIChange]]
+    ] = field(default=None, init=False, repr=False, compare=False)
+    _lifecycle_index: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def change_counts(self) -> Dict[ChangeType, int]:
+        """Number of changes per change type, computed once on first access.
+
+        Consumers that previously rescanned ``changes`` once per change type
+        can index this dictionary instead.
+        """
+        if self._change_counts is None:
+            counts = Counter(change.change_type for change in self.changes)
+            self._change_counts = {
+                change_type: counts.get(change_type, 0) for change_type in ChangeType
+            }
+        return self._change_counts
+
+    @property
+    def changes_by_pair(
+        self,
+    ) -> Dict[Tuple[Optional[str], Optional[str]], List[APIChange]]:
+        """Changes grouped by (from_version, to_version), built in one pass.
+
+        Looking up a consecutive version pair is O(1) here instead of a full
+        filter over ``changes`` per pair.
+        """
+        if self._changes_by_pair is None:
+            index = defaultdict(list)
+            for change in self.changes:
+                index[(change.from_version, change.to_version)].append(change)
+            self._changes_by_pair = dict(index)
+        return self._changes_by_pair
+
+    def get_changes_between(
+        self, from_version: Optional[str], to_version: Optional[str]
+    ) -> List[APIChange]:
+        """Get the changes recorded between two specific versions."""
+        return self.changes_by_pair.get((from_version, to_version), [])
+
+    def group_by_type(self) -> Dict[ChangeType, List[APIChange]]:
+        """Group all changes by their change type in a single pass."""
+        grouped = defaultdict(list)
+        for change in self.changes:
+            grouped[change.change_type].append(change)
+        return dict(grouped)
 
     def get_api_changes(
         self,
@@ -239,6 +430,51 @@ class AnalysisResult:
         """Get all API elements for a specific version."""
         return self.api_elements.get(version, [])
 
+    def _get_lifecycle_index(self) -> Dict[str, Any]:
+        """Get the inverted name index used by the lifecycle queries.
+
+        The index is built lazily in one pass over all elements and changes,
+        so asking about K different APIs costs one traversal plus K dict
+        lookups instead of K full traversals.
+        """
+        if self._lifecycle_index is None:
+            elements_by_name = defaultdict(list)
+            elements_by_full_name = defaultdict(list)
+            versions_by_name = defaultdict(set)
+            versions_by_full_name = defaultdict(set)
+            unique_elements = {}
+
+            for version, elements in self.api_elements.items():
+                for element in elements:
+                    elements_by_name[element.name].append((version, element))
+                    elements_by_full_name[element.full_name].append((version, element))
+                    versions_by_name[element.name].add(version)
+                    versions_by_full_name[element.full_name].add(version)
+                    unique_elements[element.full_name] = element
+
+            changes_by_name = defaultdict(list)
+            changes_by_full_name = defaultdict(list)
+            for change in self.changes:
+                changes_by_name[change.element.name].append(change)
+                changes_by_full_name[change.element.full_name].append(change)
+                unique_elements.setdefault(change.element.full_name, change.element)
+
+            self._lifecycle_index = {
+                "elements_by_name": dict(elements_by_name),
+                "elements_by_full_name": dict(elements_by_full_name),
+                "versions_by_name": dict(versions_by_name),
+                "versions_by_full_name": dict(versions_by_full_name),
+                "changes_by_name": dict(changes_by_name),
+                "changes_by_full_name": dict(changes_by_full_name),
+                "unique_elements": unique_elements,
+            }
+
+        return self._lifecycle_index
+
+    def _invalidate_lifecycle_index(self):
+        """Drop the lifecycle index; call after mutating elements or changes."""
+        self._lifecycle_index = None
+
     def _check_name_collisions(
         self, api_name: str, matches: Optional[List[APIChange]] = None
     ) -> Dict[str, Any]:
@@ -266,13 +502,11 @@ class AnalysisResult:
                     )
 
         # Also check all API elements across versions to catch any we might have missed
-        unique_elements = (
-            {}
-        )  # Use dict with full_name as key to avoid hashability issues
-        for elements in self.api_elements.values():
-            for element in elements:
-                if element.name == api_name:
-                    unique_elements[element.full_name] = element
+        index = self._get_lifecycle_index()
+        unique_elements = {
+            element.full_name: element
+            for _, element in index["elements_by_name"].get(api_name, [])
+        }
 
         # Add any API elements not already found in changes
         for element in unique_elements.values():
@@ -298,22 +532,15 @@ class AnalysisResult:
 
     def _find_exact_matches(self, api_name: str) -> List[APIChange]:
         """Find exact matches for the given API name."""
-        exact_matches = []
-        name_only_matches = []
+        index = self._get_lifecycle_index()
 
-        for change in self.changes:
-            if change.element.full_name == api_name:
-                # Exact full name match - highest priority
-                exact_matches.append(change)
-            elif change.element.name == api_name:
-                # Name-only match - need to check for collisions
-                name_only_matches.append(change)
-
-        # If we have full name matches, return those (no ambiguity)
+        # Full name matches take priority (no ambiguity)
+        exact_matches = index["changes_by_full_name"].get(api_name)
         if exact_matches:
-            return exact_matches
+            return list(exact_matches)
 
-        return name_only_matches
+        # Name-only matches - may need collision checking downstream
+        return list(index["changes_by_name"].get(api_name, []))
 
     def _calculate_element_similarity(
         self, api_name: str, element: APIElement
@@ -359,17 +586,8 @@ class AnalysisResult:
 
     def _find_fuzzy_match(self, api_name: str) -> Optional[APIElement]:
         """Find the best fuzzy match for the given API name."""
-        # Collect all unique API elements for fuzzy matching using dict to avoid hashability issues
-        unique_elements = {}
-
-        # Add elements from changes
-        for change in self.changes:
-            unique_elements[change.element.full_name] = change.element
-
-        # Add elements from all versions
-        for elements in self.api_elements.values():
-            for element in elements:
-                unique_elements[element.full_name] = element
+        # All unique API elements (from changes and versions), from the index
+        unique_elements = self._get_lifecycle_index()["unique_elements"]
 
         # Find best fuzzy match
         best_match = None
@@ -407,21 +625,20 @@ class AnalysisResult:
         self, api_name: str, matched_api: Optional[str]
     ) -> List[str]:
         """Find all versions where the API is present."""
-        versions_present = []
-        for version, elements in self.api_elements.items():
-            for element in elements:
-                # Check both exact matches and fuzzy matches
-                # If we have a matched_api (from fuzzy matching), use that for comparison
-                if matched_api:
-                    is_match = element.full_name == matched_api
-                else:
-                    # For exact matches, check both name and full_name
-                    is_match = element.name == api_name or element.full_name == api_name
+        index = self._get_lifecycle_index()
+
+        # If we have a matched_api (from fuzzy matching), use that for lookup;
+        # otherwise accept both name and full_name matches. The per-name
+        # version sets are deduplicated at index build time, so this is a
+        # plain lookup with no per-query scan
+        if matched_api:
+            present = index["versions_by_full_name"].get(matched_api, set())
+        else:
+            present = index["versions_by_name"].get(api_name, set()) | index[
+                "versions_by_full_name"
+            ].get(api_name, set())
 
-                if is_match:
-                    versions_present.append(version)
-                    break
-        return sorted(versions_present)
+        return sorted(present)
 
     def get_apis_by_name(self, api_name: str) -> List[Dict[str, Any]]:
         """Get all APIs that match a given name, including collision information.
@@ -531,49 +748,50 @@ class AnalysisResult:
             "analysis_date": self.analysis_date.isoformat(),
         }
 
-        # Count changes by type
-        change_counts = {}
-        for change_type in ChangeType:
-            change_counts[change_type.value] = len(
-                [c for c in self.changes if c.change_type == change_type]
-            )
-        summary["change_types"] = change_counts
+        # Count changes by type (single pass, memoized)
+        summary["change_types"] = {
+            change_type.value: count
+            for change_type, count in self.change_counts.items()
+        }
 
-        # Count API elements by type
-        api_counts = {}
-        all_elements = []
+        # Count API elements by type and collect unique signatures in one
+        # fused pass instead of one scan per APIType plus a signature scan
+        api_counts = Counter()
+        all_signatures = set()
         for elements in self.api_elements.values():
-            all_elements.extend(elements)
+            for element in elements:
+                api_counts[element.type] += 1
+                all_signatures.add(element.get_signature())
 
-        for api_type in APIType:
-            api_counts[api_type.value] = len(
-                [element for element in all_elements if element.type == api_type]
-            )
-        summary["api_types"] = api_counts
+        summary["api_types"] = {
+            api_type.value: api_counts.get(api_type, 0) for api_type in APIType
+        }
 
         # Add more detailed summary information
         if self.versions:
-            sorted_versions = sorted(self.versions, key=lambda v: v.version)
+            # min/max with PEP 440 ordering instead of a full lexicographic
+            # sort, which misorders versions like "10.0" before "2.0";
+            # unparseable versions fall back to string order after the rest
+            def version_key(v):
+                if v._parsed_version is not None:
+                    return (0, v._parsed_version)
+                return (1, v.version)
+
             summary["version_range"] = {
-                "first": sorted_versions[0].version,
-                "last": sorted_versions[-1].version,
+                "first": min(self.versions, key=version_key).version,
+                "last": max(self.versions, key=version_key).version,
             }
 
-        # Calculate unique APIs
-        all_signatures = set()
-        for elements in self.api_elements.values():
-            for element in elements:
-                all_signatures.add(element.get_signature())
+        # Calculate unique APIs (signatures collected in the fused pass above)
         summary["unique_apis"] = len(all_signatures)
 
-        # Add version details
+        # Add version details, counting changes per version once up front
+        # instead of rescanning the change list for every version
+        changes_per_version = Counter(
+            c.to_version for c in self.changes if c.to_version
+        )
         summary["versions"] = []
         for version in self.versions:
-            version_changes = [
-                c
-                for c in self.changes
-                if getattr(c, "to_version", None) == version.version
-            ]
             version_apis = self.api_elements.get(version.version, [])
 
             summary["versions"].append(
@@ -585,7 +803,7 @@ class AnalysisResult:
                         else "Unknown"
                     ),
                     "api_count": len(version_apis),
-                    "changes_count": len(version_changes),
+                    "changes_count": changes_per_version.get(version.version, 0),
                 }
             )
 
@@ -597,6 +815,14 @@ class AnalysisResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
+        # Changes whose element is already serialized in api_elements are
+        # emitted as thin element_ref entries; from_dict resolves the refs,
+        # so the nested element payload is only written for unlisted elements
+        listed_keys = {
+            element._signature_key
+            for elements in self.api_elements.values()
+            for element in elements
+        }
         return {
             "package_name": self.package_name,
             "versions": [v.to_dict() for v in self.versions],
@@ -604,7 +830,10 @@ class AnalysisResult:
                 version: [element.to_dict() for element in elements]
                 for version, elements in self.api_elements.items()
             },
-            "changes": [change.to_dict() for change in self.changes],
+            "changes": [
+                change.to_dict(compact=change.element._signature_key in listed_keys)
+                for change in self.changes
+            ],
             "analysis_date": self.analysis_date.isoformat(),
             "metadata": self.metadata,
             "summary": self.generate_summary(),
@@ -612,32 +841,90 @@ class AnalysisResult:
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(self.to_dict(), default=str, option=option).decode()
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
+    def to_json_file(self, path: str) -> None:
+        """Write the result as JSON to a file without building the full dict.
+
+        to_json materializes every nested element and change dict before
+        encoding anything; for large multi-version results that is a lot of
+        transient memory. This streams the same document section by section —
+        api_elements one version at a time, changes one at a time — so peak
+        memory stays at roughly one version's worth of dicts. The output is
+        identical in shape to to_dict() and loads back via from_json.
+        """
+        if orjson is not None:
+
+            def encode(obj):
+                return orjson.dumps(obj, default=str).decode()
+
+        else:
+
+            def encode(obj):
+                return json.dumps(obj, default=str)
+
+        listed_keys = {
+            element._signature_key
+            for elements in self.api_elements.values()
+            for element in elements
+        }
+
+        with open(path, "w", encoding="utf-8") as f:
+            f.write('{"package_name": ' + encode(self.package_name))
+            f.write(', "versions": ')
+            f.write(encode([v.to_dict() for v in self.versions]))
+
+            f.write(', "api_elements": {')
+            for i, (version, elements) in enumerate(self.api_elements.items()):
+                if i:
+                    f.write(", ")
+                f.write(encode(version) + ": ")
+                f.write(encode([element.to_dict() for element in elements]))
+            f.write("}")
+
+            f.write(', "changes": [')
+            for i, change in enumerate(self.changes):
+                if i:
+                    f.write(", ")
+                f.write(
+                    encode(
+                        change.to_dict(
+                            compact=change.element._signature_key in listed_keys
+                        )
+                    )
+                )
+            f.write("]")
+
+            f.write(', "analysis_date": ' + encode(self.analysis_date.isoformat()))
+            f.write(', "metadata": ' + encode(self.metadata))
+            f.write(', "summary": ' + encode(self.generate_summary()))
+            f.write("}")
+
     @classmethod
     def from_json(cls, json_str: str) -> "AnalysisResult":
         """Create AnalysisResult from JSON string."""
-        data = json.loads(json_str)
+        if orjson is not None:
+            data = orjson.loads(json_str)
+        else:
+            data = json.loads(json_str)
         return cls.from_dict(data)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AnalysisResult":
         """Create AnalysisResult from dictionary."""
+        # Local alias for the enum value map: one dict lookup per row in the
+        # hot loop below instead of the enum-call machinery
+        change_type_map = ChangeType._value2member_map_
+
         # Reconstruct versions
         versions = []
         for version_data in data.get("versions", []):
             release_date = None
             if version_data.get("release_date"):
-                try:
-                    release_date = datetime.fromisoformat(version_data["release_date"])
-                except:
-                    # Handle various date formats
-                    try:
-                        release_date = datetime.strptime(
-                            version_data["release_date"], "%Y-%m-%d"
-                        )
-                    except:
-                        release_date = None
+                release_date = _parse_date_string(version_data["release_date"])
 
             versions.append(
                 VersionInfo(
@@ -653,60 +940,56 @@ class AnalysisResult:
                 )
             )
 
-        # Reconstruct API elements
+        # Reconstruct API elements on the trusted fast path; the payload is
+        # our own to_dict output, so the dataclass __init__ can be skipped
         api_elements = {}
         for version, elements_data in data.get("api_elements", {}).items():
-            elements = []
-            for element_data in elements_data:
-                # Handle both string and enum values for type
-                api_type = element_data["type"]
-                if isinstance(api_type, str):
-                    api_type = APIType(api_type)
-
-                elements.append(
-                    APIElement(
-                        name=element_data["name"],
-                        type=api_type,
-                        module_path=element_data["module_path"],
-                        signature=element_data.get("signature"),
-                        docstring=element_data.get("docstring"),
-                        line_number=element_data.get("line_number"),
-                        is_private=element_data.get("is_private", False),
-                        is_deprecated=element_data.get("is_deprecated", False),
-                        type_hints=element_data.get("type_hints", {}),
-                        decorators=element_data.get("decorators", []),
-                        metadata=element_data.get("metadata", {}),
-                    )
-                )
-            api_elements[version] = elements
+            api_elements[version] = [
+                APIElement._from_trusted_dict(element_data)
+                for element_data in elements_data
+            ]
+
+        # Changes usually reference elements that already exist in
+        # api_elements; resolve against a signature-key table so a change
+        # shares the canonical instance instead of duplicating it
+        element_table = {
+            element._signature_key: element
+            for elements in api_elements.values()
+            for element in elements
+        }
 
         # Reconstruct changes
         changes = []
         for change_data in data.get("changes", []):
-            element_data = change_data["element"]
-
             # Handle both string and enum values
-            api_type = element_data["type"]
-            if isinstance(api_type, str):
-                api_type = APIType(api_type)
-
-            change_type = change_data["change_type"]
-            if isinstance(change_type, str):
-                change_type = ChangeType(change_type)
-
-            element = APIElement(
-                name=element_data["name"],
-                type=api_type,
-                module_path=element_data["module_path"],
-                signature=element_data.get("signature"),
-                docstring=element_data.get("docstring"),
-                line_number=element_data.get("line_number"),
-                is_private=element_data.get("is_private", False),
-                is_deprecated=element_data.get("is_deprecated", False),
-                type_hints=element_data.get("type_hints", {}),
-                decorators=element_data.get("decorators", []),
-                metadata=element_data.get("metadata", {}),
-            )
+            change_type = change_type_map.get(change_data["change_type"])
+            if change_type is None:
+                change_type = change_data["change_type"]
+                if isinstance(change_type, str):
+                    change_type = ChangeType(change_type)
+
+            element = None
+            element_data = change_data.get("element")
+            element_ref = change_data.get("element_ref")
+            if element_ref is not None:
+                # Compact form: the canonical element lives in api_elements
+                # and the change carries its signature key; the identity
+                # fields alongside it serve as a fallback below
+                element = element_table.get(element_ref)
+
+            if element is None:
+                if element_data is None:
+                    continue
+                # Same key formula as APIElement.get_signature
+                signature = element_data.get("signature")
+                if signature and signature.strip():
+                    key = f"{element_data['module_path']}.{element_data['name']}:{signature}"
+                else:
+                    key = f"{element_data['module_path']}.{element_data['name']}:{element_data['type']}"
+                element = element_table.get(key)
+                if element is None:
+                    element = APIElement._from_trusted_dict(element_data)
+                    element_table[key] = element
 
             changes.append(
                 APIChange(
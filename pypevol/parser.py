@@ -1,8 +1,10 @@
 """Python source code parser for API extraction."""
 
 import ast
+import multiprocessing
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Any, Union
 import logging
@@ -19,22 +21,32 @@ class ParseContext:
 
     module_path: str
     file_path: Path
-    source_code: str
     tree: ast.AST
 
 
 class SourceParser:
     """Parses Python source code to extract API elements."""
 
-    def __init__(self, include_private: bool = False, include_deprecated: bool = True):
+    def __init__(
+        self,
+        include_private: bool = False,
+        include_deprecated: bool = True,
+        parse_bodies: bool = True,
+    ):
         """Initialize the source parser.
 
         Args:
             include_private: Whether to include private APIs (starting with _)
             include_deprecated: Whether to include deprecated APIs
+            parse_bodies: Whether to descend into function bodies. API
+                extraction only needs signatures, so disabling this skips the
+                traversal of body statements for a faster parse of large
+                packages. Nested (closure-local) definitions are not reported
+                when disabled.
         """
         self.include_private = include_private
         self.include_deprecated = include_deprecated
+        self.parse_bodies = parse_bodies
         self.deprecation_patterns = [
             r"@deprecated",
             r".. deprecated::",
@@ -42,10 +54,23 @@ class SourceParser:
             r"This.*deprecated",
             r"deprecated.*use",
         ]
+        # Compile the patterns into one alternation up front instead of
+        # running re.search per pattern per docstring
+        self._deprecation_re = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.deprecation_patterns),
+            re.IGNORECASE,
+        )
+
+    # Packages below this size are parsed serially; process startup would
+    # cost more than the parallel AST work saves
+    PARALLEL_PARSE_THRESHOLD = 8
 
     def parse_package(self, package_path: Path, package_name: str) -> List[APIElement]:
         """Parse an entire package directory.
 
+        AST extraction is CPU-bound and holds the GIL, so large packages are
+        fanned out across a process pool; small ones are parsed serially.
+
         Args:
             package_path: Path to the package directory
             package_name: Name of the package
@@ -62,25 +87,47 @@ class SourceParser:
         else:
             python_files = list(package_path.rglob("*.py"))
 
+        # Resolve module paths up front, skipping non-source directories
+        jobs = []
         for file_path in python_files:
             try:
-                # Skip __pycache__ and other non-source directories
                 if "__pycache__" in str(file_path):
                     continue
-
-                # Determine module path
                 module_path = self._get_module_path(
                     file_path, package_path, package_name
                 )
-
-                # Parse the file
-                file_elements = self.parse_file(file_path, module_path)
-                api_elements.extend(file_elements)
-
+                jobs.append((file_path, module_path))
             except Exception as e:
                 logger.warning(f"Failed to parse {file_path}: {e}")
                 continue
 
+        if len(jobs) > self.PARALLEL_PARSE_THRESHOLD:
+            # parse_file handles its own errors, so worker results are always
+            # plain element lists. Workers start via forkserver: parse_package
+            # runs inside the analyzer's worker threads, and fork()ing a
+            # multithreaded process can deadlock on locks held by sibling
+            # threads (logging, the shared requests session). Cap the pool so
+            # concurrent analyzer threads do not each claim every core.
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context("forkserver")
+            else:
+                mp_context = multiprocessing.get_context("spawn")
+            max_workers = max(1, (os.cpu_count() or 1) // 2)
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(jobs)),
+                mp_context=mp_context,
+            ) as executor:
+                results = executor.map(
+                    self.parse_file,
+                    [file_path for file_path, _ in jobs],
+                    [module_path for _, module_path in jobs],
+                )
+                for file_elements in results:
+                    api_elements.extend(file_elements)
+        else:
+            for file_path, module_path in jobs:
+                api_elements.extend(self.parse_file(file_path, module_path))
+
         return api_elements
 
     def parse_file(self, file_path: Path, module_path: str) -> List[APIElement]:
@@ -94,17 +141,62 @@ class SourceParser:
             List of API elements found in the file
         """
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                source_code = f.read()
+            source_code = file_path.read_bytes()
+        except OSError as e:
+            logger.error(f"Failed to parse {file_path}: {e}")
+            return []
 
-            # Parse the AST
-            tree = ast.parse(source_code, filename=str(file_path))
+        return self.parse_source(source_code, module_path, filename=str(file_path))
+
+    def parse_source(
+        self,
+        source_code: Union[str, bytes],
+        module_path: str,
+        filename: str = "<string>",
+    ) -> List[APIElement]:
+        """Parse Python source held in memory.
+
+        Args:
+            source_code: Source text or raw bytes to parse
+            module_path: Module path (e.g., 'package.module')
+            filename: Filename used in error messages
+
+        Returns:
+            List of API elements found in the source
+        """
+        try:
+            # Hand raw bytes to compile, which performs the PEP 263 decode
+            # itself in C; only fall back to a lenient Python-level decode for
+            # sources with broken encodings
+            try:
+                tree = compile(
+                    source_code,
+                    filename,
+                    "exec",
+                    flags=ast.PyCF_ONLY_AST,
+                    dont_inherit=True,
+                )
+            except (SyntaxError, ValueError):
+                if not isinstance(source_code, bytes):
+                    raise
+                source_code = source_code.decode("utf-8", errors="ignore")
+                tree = compile(
+                    source_code,
+                    filename,
+                    "exec",
+                    flags=ast.PyCF_ONLY_AST,
+                    dont_inherit=True,
+                )
+
+            # Nothing downstream reads the raw source, so drop the reference
+            # and let a multi-MB buffer be freed while the much smaller tree
+            # is walked
+            del source_code
 
             # Create parse context
             context = ParseContext(
                 module_path=module_path,
-                file_path=file_path,
-                source_code=source_code,
+                file_path=Path(filename),
                 tree=tree,
             )
 
@@ -115,7 +207,7 @@ class SourceParser:
             return visitor.api_elements
 
         except Exception as e:
-            logger.error(f"Failed to parse {file_path}: {e}")
+            logger.error(f"Failed to parse {filename}: {e}")
             return []
 
     def _get_module_path(
@@ -171,10 +263,8 @@ class SourceParser:
                     return True
 
         # Check docstring
-        if docstring:
-            for pattern in self.deprecation_patterns:
-                if re.search(pattern, docstring, re.IGNORECASE):
-                    return True
+        if docstring and self._deprecation_re.search(docstring):
+            return True
 
         return False
 
@@ -318,12 +408,14 @@ class APIVisitor(ast.NodeVisitor):
     def visit_FunctionDef(self, node: ast.FunctionDef):
         """Visit function definition."""
         self._visit_function(node)
-        self.generic_visit(node)
+        if self.parser.parse_bodies:
+            self.generic_visit(node)
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
         """Visit async function definition."""
         self._visit_function(node)
-        self.generic_visit(node)
+        if self.parser.parse_bodies:
+            self.generic_visit(node)
 
     def _visit_function(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]):
         """Handle function/method definitions."""
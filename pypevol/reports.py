@@ -1,41 +1,185 @@
 """Report generation for PyPevol."""
 
+import csv
+import io
 import json
-from typing import Dict, Any, List
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import os
 
 from .models import ChangeType, APIType
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Filename extension -> report format for save_report auto-detection
+_EXT_TO_FORMAT = {
+    ".json": "json",
+    ".html": "html",
+    ".htm": "html",
+    ".csv": "csv",
+    ".md": "markdown",
+    ".markdown": "markdown",
+}
+
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+
+def _escape_html(value: Any) -> str:
+    """Escape a value for embedding in HTML markup.
+
+    One str.translate pass with a precomputed table instead of the usual
+    chain of five .replace calls (five passes, five intermediate strings).
+    """
+    return str(value).translate(_HTML_ESCAPE_TABLE)
+
+
+_SIMPLE_PLACEHOLDER_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+
+class _EscapingDict(dict):
+    """format_map mapping that HTML-escapes values and blanks missing keys.
+
+    Mirrors the autoescaping Jinja environment so the fast path and the
+    full path render variables identically.
+    """
+
+    def __getitem__(self, key):
+        try:
+            value = dict.__getitem__(self, key)
+        except KeyError:
+            return ""
+        return _escape_html(value)
+
+
+@lru_cache(maxsize=32)
+def _compile_simple_template(template_str: str) -> Optional[str]:
+    """Precompile a {{var}}-only template to a str.format_map string.
+
+    str.format_map walks the template in one C pass, where Jinja pays its
+    full lexer/parser/codegen pipeline plus a Python frame per render.
+
+    Returns:
+        The transformed template, or None when the template needs full
+        Jinja (control flow, comments, dotted names or literal braces).
+    """
+    if "{%" in template_str or "{#" in template_str:
+        return None
+
+    transformed = _SIMPLE_PLACEHOLDER_RE.sub(r"{\1}", template_str)
+    leftover = re.sub(r"\{\w+\}", "", transformed)
+    if "{" in leftover or "}" in leftover:
+        return None
+    return transformed
+
+
+# Shared Jinja environment, created on first custom-template render so that
+# importing this module stays cheap for callers that never use templates
+_jinja_env = None
+
+
+@lru_cache(maxsize=32)
+def _compile_template(template_str: str):
+    """Compile a Jinja2 template, memoized by template source.
+
+    Jinja's lexer/parser/codegen pipeline runs once per distinct template
+    string; repeated renders of the same custom template reuse the compiled
+    template object.
+    """
+    global _jinja_env
+    if _jinja_env is None:
+        import jinja2
+
+        _jinja_env = jinja2.Environment(autoescape=True, auto_reload=False)
+    return _jinja_env.from_string(template_str)
+
+
+# Constant-time outputs for packages with nothing to report; the full
+# generators pay chart aggregation and table formatting even for zero rows
+_EMPTY_HTML_TMPL = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>API Evolution Report - {package_name}</title>
+</head>
+<body>
+    <h1>API Evolution Report</h1>
+    <p>Package: <strong>{package_name}</strong></p>
+    <p>No versions or API changes were found for this package.</p>
+</body>
+</html>"""
+
+_EMPTY_MD_TMPL = """# API Evolution Report: {package_name}
+
+No versions or API changes were found for this package.
+"""
+
+
+def _summary_counts(summary: Dict[str, Any]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Get per-change-type and per-API-type counts from a summary dict.
+
+    Accepts both the report-style keys (changes_by_type/apis_by_type) and
+    the keys AnalysisResult.generate_summary emits (change_types/api_types),
+    so results can be fed straight from AnalysisResult.to_dict.
+    """
+    changes_by_type = summary.get("changes_by_type") or summary.get("change_types", {})
+    apis_by_type = summary.get("apis_by_type") or summary.get("api_types", {})
+    return changes_by_type, apis_by_type
+
+
+def _is_empty_result(result_data: Dict[str, Any]) -> bool:
+    """Check whether a result has no versions, changes or elements."""
+    return not (
+        result_data.get("versions")
+        or result_data.get("changes")
+        or result_data.get("api_elements")
+    )
+
+
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
 
 class ReportGenerator:
     """Generates various types of reports from analysis results."""
 
+    __slots__ = ("template_dir",)
+
     def __init__(self):
         """Initialize the report generator."""
-        self.template_dir = Path(__file__).parent / "templates"
+        self.template_dir = _TEMPLATE_DIR
 
     def generate_single_package_report(
-        self, result_data: Dict[str, Any], format_type: str
+        self,
+        result_data: Dict[str, Any],
+        format_type: str,
+        template: Optional[str] = None,
     ) -> str:
         """Generate a report for a single package.
 
         Args:
             result_data: Analysis result data
-            format_type: Output format ('html', 'markdown', 'csv')
+            format_type: Output format ('html', 'markdown', 'csv', 'json')
+            template: Optional custom template string rendered with the
+                result data instead of the built-in layout
 
         Returns:
             Report content as string
         """
-        if format_type == "html":
-            return self._generate_html_report(result_data)
-        elif format_type == "markdown":
-            return self._generate_markdown_report(result_data)
-        elif format_type == "csv":
-            return self._generate_csv_report(result_data)
-        else:
+        if template is not None:
+            return self._render_template(template, result_data)
+
+        generate = self._FORMAT_DISPATCH.get(format_type)
+        if generate is None:
             raise ValueError(f"Unsupported format: {format_type}")
+        return generate(self, result_data)
 
     def generate_multi_package_report(
         self, results_data: Dict[str, Dict[str, Any]], format_type: str
@@ -49,26 +193,48 @@ class ReportGenerator:
         Returns:
             Report content as string
         """
-        if format_type == "html":
-            return self._generate_multi_html_report(results_data)
-        elif format_type == "markdown":
-            return self._generate_multi_markdown_report(results_data)
-        else:
+        generate = self._MULTI_FORMAT_DISPATCH.get(format_type)
+        if generate is None:
             raise ValueError(f"Unsupported format for multi-package: {format_type}")
+        return generate(self, results_data)
+
+    def _render_template(self, template_str: str, variables: Dict[str, Any]) -> str:
+        """Render a custom report template with the given variables.
+
+        Args:
+            template_str: Template source
+            variables: Values exposed to the template
+
+        Returns:
+            Rendered template as string
+        """
+        simple = _compile_simple_template(template_str)
+        if simple is not None:
+            return simple.format_map(_EscapingDict(variables))
+        return _compile_template(template_str).render(**variables)
 
     def _generate_html_report(self, result_data: Dict[str, Any]) -> str:
         """Generate HTML report for a single package."""
-        package_name = result_data["package_name"]
+        package_name = _escape_html(result_data["package_name"])
+        if _is_empty_result(result_data):
+            return _EMPTY_HTML_TMPL.format(package_name=package_name)
         summary = result_data["summary"]
+        changes_by_type, _ = _summary_counts(summary)
         versions = result_data["versions"]
         changes = result_data["changes"]
 
-        # Generate charts data
-        version_timeline = self._generate_version_timeline_data(versions, changes)
-        change_distribution = self._generate_change_distribution_data(changes)
+        # Generate charts data; the timeline and distribution charts share
+        # one aggregation pass over the changes list
+        changes_by_version, distribution = self._aggregate_changes(changes)
+        version_timeline = self._generate_version_timeline_data(
+            versions, changes_by_version
+        )
+        change_distribution = self._generate_change_distribution_data(distribution)
         api_evolution = self._generate_api_evolution_data(result_data)
 
-        html_content = f"""<!DOCTYPE html>
+        # Collect the document in a list and join once; += per table row
+        # reallocates the whole report string as it grows
+        parts = [f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -183,11 +349,11 @@ class ReportGenerator:
                 <div class="label">API Changes</div>
             </div>
             <div class="summary-card">
-                <div class="number">{summary['changes_by_type'].get('added', 0)}</div>
+                <div class="number">{changes_by_type.get('added', 0)}</div>
                 <div class="label">APIs Added</div>
             </div>
             <div class="summary-card">
-                <div class="number">{summary['changes_by_type'].get('removed', 0)}</div>
+                <div class="number">{changes_by_type.get('removed', 0)}</div>
                 <div class="label">APIs Removed</div>
             </div>
         </div>
@@ -219,28 +385,28 @@ class ReportGenerator:
                     </tr>
                 </thead>
                 <tbody>
-"""
+"""]
 
         # Add recent changes to table
         for change in sorted(
             changes, key=lambda x: x.get("to_version", ""), reverse=True
         )[:20]:
-            change_type = change["change_type"]
+            change_type = _escape_html(change["change_type"])
             change_class = f"change-{change_type}"
-            api_name = change["element"]["full_name"]
-            description = change.get("description", "")
-            version = change.get("to_version", "")
+            api_name = _escape_html(change["element"]["full_name"])
+            description = _escape_html(change.get("description", ""))
+            version = _escape_html(change.get("to_version", ""))
 
-            html_content += f"""
+            parts.append(f"""
                     <tr>
                         <td>{version}</td>
                         <td class="{change_class}">{change_type.upper()}</td>
                         <td class="signature">{api_name}</td>
                         <td>{description}</td>
                     </tr>
-"""
+""")
 
-        html_content += f"""
+        parts.append(f"""
                 </tbody>
             </table>
         </div>
@@ -260,115 +426,211 @@ class ReportGenerator:
         Plotly.newPlot('evolution-chart', evolutionData.data, evolutionData.layout, {{responsive: true}});
     </script>
 </body>
-</html>"""
+</html>""")
 
-        return html_content
+        return "".join(parts)
 
-    def _generate_markdown_report(self, result_data: Dict[str, Any]) -> str:
-        """Generate Markdown report for a single package."""
-        package_name = result_data["package_name"]
-        summary = result_data["summary"]
-        versions = result_data["versions"]
-        changes = result_data["changes"]
+    def _json_report_bytes(self, result_data: Dict[str, Any]) -> bytes:
+        """Serialize the JSON report to UTF-8 bytes.
 
-        markdown_content = f"""# API Evolution Report: {package_name}
+        Serializes with orjson when it is installed; the result data is
+        already plain dicts, so the whole dump runs in C instead of the
+        stdlib encoder's Python dict-walk.
+        """
+        if orjson is not None:
+            return orjson.dumps(result_data, default=str, option=orjson.OPT_INDENT_2)
+        return json.dumps(result_data, indent=2, default=str).encode("utf-8")
 
-Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+    def _generate_json_report(self, result_data: Dict[str, Any]) -> str:
+        """Generate JSON report for a single package."""
+        return self._json_report_bytes(result_data).decode("utf-8")
 
-## Summary
+    def _get_format_from_filename(self, filename: str) -> str:
+        """Infer the report format from a filename extension.
 
-- **Versions Analyzed**: {summary['total_versions']}
-- **Total API Changes**: {summary['total_changes']}
-- **APIs Added**: {summary['changes_by_type'].get('added', 0)}
-- **APIs Removed**: {summary['changes_by_type'].get('removed', 0)}
-- **APIs Modified**: {summary['changes_by_type'].get('modified', 0)}
-- **APIs Deprecated**: {summary['changes_by_type'].get('deprecated', 0)}
+        Args:
+            filename: Report filename or path
 
-## Change Distribution by Type
+        Returns:
+            Format name; defaults to 'json' for unknown extensions
+        """
+        _, ext = os.path.splitext(str(filename))
+        return _EXT_TO_FORMAT.get(ext.lower(), "json")
 
-"""
+    def save_report(
+        self,
+        result_data: Dict[str, Any],
+        filepath: str,
+        format_type: Optional[str] = None,
+    ) -> Path:
+        """Save a single-package report to a file.
 
-        for change_type, count in summary["changes_by_type"].items():
-            if count > 0:
-                markdown_content += f"- **{change_type.title()}**: {count} changes\\n"
+        JSON reports are written as the UTF-8 bytes the serializer already
+        produced, skipping a decode/re-encode round trip over the full
+        report; text formats are written with explicit UTF-8 encoding.
 
-        markdown_content += f"""
+        Args:
+            result_data: Analysis result data
+            filepath: Destination path; its extension picks the format when
+                format_type is None
+            format_type: Output format ('html', 'markdown', 'csv', 'json')
 
-## API Type Distribution
+        Returns:
+            Path the report was written to
+        """
+        path = Path(filepath)
+        if format_type is None:
+            format_type = self._get_format_from_filename(path.name)
 
-"""
+        with open(path, "wb") as f:
+            self.save_report_to_stream(result_data, f, format_type)
 
-        for api_type, count in summary["apis_by_type"].items():
-            if count > 0:
-                markdown_content += f"- **{api_type.title()}**: {count} APIs\\n"
+        return path
 
-        # Recent changes
-        markdown_content += """
+    def save_report_to_stream(
+        self, result_data: Dict[str, Any], stream: Any, format_type: str
+    ) -> None:
+        """Write a report to an open binary stream as UTF-8 bytes.
 
-## Recent API Changes
+        Lets callers target in-memory buffers (io.BytesIO) or sockets
+        without a temp-file round trip; save_report delegates here. CSV
+        rows are streamed one at a time rather than materialized.
 
-| Version | Change Type | API | Description |
-|---------|-------------|-----|-------------|
-"""
+        Args:
+            result_data: Analysis result data
+            stream: Writable binary stream
+            format_type: Output format ('html', 'markdown', 'csv', 'json')
+        """
+        if format_type == "json":
+            stream.write(self._json_report_bytes(result_data))
+        elif format_type == "csv":
+            for line in self._iter_csv_report(result_data):
+                stream.write(line.encode("utf-8"))
+        else:
+            content = self.generate_single_package_report(result_data, format_type)
+            stream.write(content.encode("utf-8"))
 
-        for change in sorted(
-            changes, key=lambda x: x.get("to_version", ""), reverse=True
-        )[:20]:
-            change_type = change["change_type"].upper()
-            api_name = change["element"]["full_name"]
-            description = change.get("description", "")
-            version = change.get("to_version", "")
+    def _generate_markdown_report(self, result_data: Dict[str, Any]) -> str:
+        """Generate Markdown report for a single package.
 
-            markdown_content += (
-                f"| {version} | {change_type} | `{api_name}` | {description} |\\n"
-            )
+        Lines are collected in a list and joined once at the end; repeated
+        += on the report string reallocates quadratically as it grows.
+        """
+        package_name = result_data["package_name"]
+        if _is_empty_result(result_data):
+            return _EMPTY_MD_TMPL.format(package_name=package_name)
 
-        # Version history
-        markdown_content += """
+        summary = result_data["summary"]
+        changes_by_type, apis_by_type = _summary_counts(summary)
+        versions = result_data["versions"]
+        changes = result_data["changes"]
+
+        parts = [
+            f"# API Evolution Report: {package_name}",
+            "",
+            f'Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}',
+            "",
+            "## Summary",
+            "",
+            f"- **Versions Analyzed**: {summary['total_versions']}",
+            f"- **Total API Changes**: {summary['total_changes']}",
+            f"- **APIs Added**: {changes_by_type.get('added', 0)}",
+            f"- **APIs Removed**: {changes_by_type.get('removed', 0)}",
+            f"- **APIs Modified**: {changes_by_type.get('modified', 0)}",
+            f"- **APIs Deprecated**: {changes_by_type.get('deprecated', 0)}",
+            "",
+            "## Change Distribution by Type",
+            "",
+        ]
 
-## Version History
+        parts.extend(
+            f"- **{change_type.title()}**: {count} changes"
+            for change_type, count in changes_by_type.items()
+            if count > 0
+        )
 
-"""
+        parts.extend(["", "## API Type Distribution", ""])
+        parts.extend(
+            f"- **{api_type.title()}**: {count} APIs"
+            for api_type, count in apis_by_type.items()
+            if count > 0
+        )
 
+        # Recent changes
+        parts.extend(
+            [
+                "",
+                "## Recent API Changes",
+                "",
+                "| Version | Change Type | API | Description |",
+                "|---------|-------------|-----|-------------|",
+            ]
+        )
+        parts.extend(
+            f"| {change.get('to_version', '')} | {change['change_type'].upper()} "
+            f"| `{change['element']['full_name']}` | {change.get('description', '')} |"
+            for change in sorted(
+                changes, key=lambda x: x.get("to_version", ""), reverse=True
+            )[:20]
+        )
+
+        # Version history
+        parts.extend(["", "## Version History", ""])
         for version in sorted(
             versions, key=lambda x: x.get("release_date", ""), reverse=True
         ):
-            version_num = version["version"]
             release_date = version.get("release_date", "Unknown")
             if release_date != "Unknown":
                 release_date = release_date.split("T")[0]  # Just the date part
+            parts.append(f"- **{version['version']}** ({release_date})")
 
-            markdown_content += f"- **{version_num}** ({release_date})\\n"
+        return "\n".join(parts)
 
-        return markdown_content
-
-    def _generate_csv_report(self, result_data: Dict[str, Any]) -> str:
-        """Generate CSV report for a single package."""
-        changes = result_data["changes"]
+    def _iter_csv_report(self, result_data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the CSV report line by line.
 
-        csv_content = "Version,Change Type,API Type,API Name,Module Path,Description,Old Signature,New Signature\\n"
-
-        for change in changes:
-            version = change.get("to_version", "")
-            change_type = change["change_type"]
-            api_type = change["element"]["type"]
-            api_name = change["element"]["name"]
-            module_path = change["element"]["module_path"]
-            description = change.get("description", "").replace(",", ";")
-            old_sig = (
-                change.get("old_signature", "").replace(",", ";")
-                if change.get("old_signature")
-                else ""
-            )
-            new_sig = (
-                change.get("new_signature", "").replace(",", ";")
-                if change.get("new_signature")
-                else ""
+        Rows go through csv.writer, which quotes fields in a C loop instead
+        of per-field Python replace calls; save_report streams the lines
+        straight to the file, keeping peak memory at one row rather than
+        the whole report.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+
+        writer.writerow(
+            [
+                "Version",
+                "Change Type",
+                "API Type",
+                "API Name",
+                "Module Path",
+                "Description",
+                "Old Signature",
+                "New Signature",
+            ]
+        )
+        yield buffer.getvalue()
+
+        for change in result_data["changes"]:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(
+                (
+                    change.get("to_version", ""),
+                    change["change_type"],
+                    change["element"]["type"],
+                    change["element"]["name"],
+                    change["element"]["module_path"],
+                    change.get("description", ""),
+                    change.get("old_signature") or "",
+                    change.get("new_signature") or "",
+                )
             )
+            yield buffer.getvalue()
 
-            csv_content += f'"{version}","{change_type}","{api_type}","{api_name}","{module_path}","{description}","{old_sig}","{new_sig}"\\n'
-
-        return csv_content
+    def _generate_csv_report(self, result_data: Dict[str, Any]) -> str:
+        """Generate CSV report for a single package."""
+        return "".join(self._iter_csv_report(result_data))
 
     def _generate_multi_markdown_report(
         self, results_data: Dict[str, Dict[str, Any]]
@@ -391,19 +653,19 @@ This report analyzes the API evolution of {len(results_data)} packages.
 
         for package_name, result_data in results_data.items():
             summary = result_data["summary"]
-            changes_by_type = summary["changes_by_type"]
+            changes_by_type, _ = _summary_counts(summary)
 
             markdown_content += f"""| {package_name} | {summary['total_versions']} | {summary['total_changes']} | {changes_by_type.get('added', 0)} | {changes_by_type.get('removed', 0)} | {changes_by_type.get('modified', 0)} | {changes_by_type.get('deprecated', 0)} |
 """
 
         # Individual package reports
         for package_name, result_data in results_data.items():
-            markdown_content += f"\\n## {package_name}\\n\\n"
+            markdown_content += f"\n## {package_name}\n\n"
             package_report = self._generate_markdown_report(result_data)
             # Remove the main title and add content
-            lines = package_report.split("\\n")[3:]  # Skip first 3 lines
-            markdown_content += "\\n".join(lines)
-            markdown_content += "\\n---\\n"
+            lines = package_report.split("\n")[3:]  # Skip first 3 lines
+            markdown_content += "\n".join(lines)
+            markdown_content += "\n---\n"
 
         return markdown_content
 
@@ -412,7 +674,7 @@ This report analyzes the API evolution of {len(results_data)} packages.
     ) -> str:
         """Generate HTML report for multiple packages."""
         # For simplicity, generate individual reports and combine them
-        html_content = """<!DOCTYPE html>
+        parts = ["""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -427,38 +689,51 @@ This report analyzes the API evolution of {len(results_data)} packages.
 </head>
 <body>
     <h1>Multi-Package API Evolution Report</h1>
-"""
+"""]
 
         for package_name, result_data in results_data.items():
-            html_content += f'<div class="package-section">'
+            parts.append('<div class="package-section">')
             package_report = self._generate_html_report(result_data)
             # Extract body content
             body_start = package_report.find("<body>") + 6
             body_end = package_report.find("</body>")
-            body_content = package_report[body_start:body_end]
-            html_content += body_content
-            html_content += "</div>"
+            parts.append(package_report[body_start:body_end])
+            parts.append("</div>")
+
+        parts.append("</body></html>")
+        return "".join(parts)
 
-        html_content += "</body></html>"
-        return html_content
+    def _aggregate_changes(
+        self, changes: List[Dict]
+    ) -> Tuple[Dict[str, Dict[str, int]], Dict[str, int]]:
+        """Aggregate changes by version and by type in a single pass.
+
+        The timeline and distribution charts each need a full walk over the
+        changes list; computing both groupings together halves the scans on
+        large change lists.
+
+        Args:
+            changes: Serialized change dictionaries
+
+        Returns:
+            Tuple of (per-version change-type counts, overall change-type
+            counts)
+        """
+        changes_by_version = defaultdict(
+            lambda: {"added": 0, "removed": 0, "modified": 0, "deprecated": 0}
+        )
+        distribution = Counter()
+        for change in changes:
+            change_type = change["change_type"]
+            changes_by_version[change.get("to_version", "")][change_type] += 1
+            distribution[change_type] += 1
+
+        return changes_by_version, distribution
 
     def _generate_version_timeline_data(
-        self, versions: List[Dict], changes: List[Dict]
+        self, versions: List[Dict], changes_by_version: Dict[str, Dict[str, int]]
     ) -> Dict:
         """Generate data for version timeline chart."""
-        # Group changes by version
-        changes_by_version = {}
-        for change in changes:
-            version = change.get("to_version", "")
-            if version not in changes_by_version:
-                changes_by_version[version] = {
-                    "added": 0,
-                    "removed": 0,
-                    "modified": 0,
-                    "deprecated": 0,
-                }
-            changes_by_version[version][change["change_type"]] += 1
-
         versions_list = [
             v["version"]
             for v in sorted(versions, key=lambda x: x.get("release_date", ""))
@@ -489,13 +764,8 @@ This report analyzes the API evolution of {len(results_data)} packages.
             },
         }
 
-    def _generate_change_distribution_data(self, changes: List[Dict]) -> Dict:
+    def _generate_change_distribution_data(self, distribution: Dict[str, int]) -> Dict:
         """Generate data for change distribution pie chart."""
-        distribution = {}
-        for change in changes:
-            change_type = change["change_type"]
-            distribution[change_type] = distribution.get(change_type, 0) + 1
-
         return {
             "data": [
                 {
@@ -550,3 +820,17 @@ This report analyzes the API evolution of {len(results_data)} packages.
                 "height": 500,
             },
         }
+
+    # Format name -> unbound generator method; defined after the methods so
+    # the references resolve. Dict lookup replaces the former if/elif chains.
+    _FORMAT_DISPATCH = {
+        "html": _generate_html_report,
+        "markdown": _generate_markdown_report,
+        "csv": _generate_csv_report,
+        "json": _generate_json_report,
+    }
+
+    _MULTI_FORMAT_DISPATCH = {
+        "html": _generate_multi_html_report,
+        "markdown": _generate_multi_markdown_report,
+    }
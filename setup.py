@@ -30,13 +30,11 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "requests>=2.25.0",
         "beautifulsoup4>=4.9.0",
@@ -53,6 +51,7 @@ setup(
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.12.0",
+            "pytest-xdist>=2.5.0",
             "black>=21.0.0",
             "flake8>=3.9.0",
             "mypy>=0.910",
@@ -63,6 +62,10 @@ setup(
             "build>=0.8.0",
             "twine>=4.0.0",
         ],
+        "speed": [
+            "orjson>=3.8.0",
+            "brotli>=1.0.9",
+        ],
     },
     include_package_data=True,
     package_data={
@@ -98,43 +98,48 @@ def analyze_requests_post():
 
         # Analyze post function details
         if post_instances:
-            print(f"\n📋 requests.post Function Analysis:")
-            print("   " + "-" * 40)
+            # Buffer report lines and write them in one go instead of one
+            # flushing print call per line
+            lines = [f"\n📋 requests.post Function Analysis:", "   " + "-" * 40]
 
             for version, api in post_instances:
-                print(f"   📦 Version {version}:")
-                print(f"      Module: {api.module_path}")
-                print(f"      Full name: {api.full_name}")
+                lines.append(f"   📦 Version {version}:")
+                lines.append(f"      Module: {api.module_path}")
+                lines.append(f"      Full name: {api.full_name}")
 
                 if api.signature:
                     signatures[version] = api.signature
-                    print(f"      Signature: {api.signature}")
+                    lines.append(f"      Signature: {api.signature}")
                 else:
-                    print(f"      Signature: Not available")
+                    lines.append(f"      Signature: Not available")
 
                 if api.docstring:
                     # Show first line of docstring
                     first_line = api.docstring.split("\n")[0]
                     docstrings[version] = api.docstring
-                    print(f"      Docstring: {first_line}...")
+                    lines.append(f"      Docstring: {first_line}...")
 
-                print()
+                lines.append("")
 
             # Compare signatures across versions
-            print(f"🔄 Signature Evolution:")
-            print("   " + "-" * 30)
+            lines.append(f"🔄 Signature Evolution:")
+            lines.append("   " + "-" * 30)
 
             if len(signatures) > 1:
                 versions_with_sigs = sorted(signatures.keys())
                 for i, version in enumerate(versions_with_sigs):
-                    print(f"   {version}: {signatures[version]}")
+                    lines.append(f"   {version}: {signatures[version]}")
 
                     if i > 0:
                         prev_version = versions_with_sigs[i - 1]
                         if signatures[version] != signatures[prev_version]:
-                            print("      ⚠️  SIGNATURE CHANGED!")
+                            lines.append("      ⚠️  SIGNATURE CHANGED!")
             else:
-                print("   No signature changes detected (or limited signature data)")
+                lines.append(
+                    "   No signature changes detected (or limited signature data)"
+                )
+
+            sys.stdout.write("\n".join(lines) + "\n")
 
         # Check for POST-related changes
         print(f"\n🔄 POST-Related API Changes:")
@@ -156,13 +161,18 @@ def analyze_requests_post():
             for change_type, count in change_stats.items():
                 print(f"   {change_type.title()}: {count}")
 
-            print(f"\n   Detailed changes:")
+            lines = [f"\n   Detailed changes:"]
             for change in post_changes[:5]:  # Show first 5
-                print(f"   • {change.change_type.value}: {change.element.full_name}")
-                print(f"     Version: {change.from_version} → {change.to_version}")
+                lines.append(
+                    f"   • {change.change_type.value}: {change.element.full_name}"
+                )
+                lines.append(
+                    f"     Version: {change.from_version} → {change.to_version}"
+                )
                 if change.description:
-                    print(f"     Description: {change.description}")
-                print()
+                    lines.append(f"     Description: {change.description}")
+                lines.append("")
+            sys.stdout.write("\n".join(lines) + "\n")
         else:
             print("   No POST-specific changes detected")
 
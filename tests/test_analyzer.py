@@ -1,9 +1,11 @@
 """Tests for PackageAnalyzer."""
 
+import re
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 from pathlib import Path
+import shutil
 import tempfile
 import zipfile
 import os
@@ -20,17 +22,30 @@ from pypevol.models import (
 from pypevol.parser import SourceParser
 from pypevol.fetcher import PyPIFetcher
 
+# Single pattern for the parameter-conflict error so assertions do not break
+# on minor rewording of the message
+CONFLICT_MESSAGE_RE = re.compile(r"Cannot specify .* together with")
+
 
 class TestPackageAnalyzer(unittest.TestCase):
     """Test PackageAnalyzer class."""
 
     def setUp(self):
         """Set up test data."""
+        self.api_cache_dir = tempfile.mkdtemp()
+        # Point the persistent download cache at a tempdir so constructing
+        # analyzers (including the bare ones in test_init*) never creates
+        # directories under the real user home
+        self.download_cache_dir = tempfile.mkdtemp()
+        env_patcher = patch.dict(os.environ, {"PYPEVOL_CACHE": self.download_cache_dir})
+        env_patcher.start()
+        self.addCleanup(env_patcher.stop)
         self.analyzer = PackageAnalyzer(
             cache_dir=None,
             include_private=False,
             include_deprecated=True,
             prefer_wheels=True,
+            api_cache_dir=Path(self.api_cache_dir),
         )
 
         # Create mock version info
@@ -59,6 +74,11 @@ class TestPackageAnalyzer(unittest.TestCase):
             signature="function2(arg: str) -> str",
         )
 
+    def tearDown(self):
+        """Clean up the per-test cache directories."""
+        shutil.rmtree(self.api_cache_dir, ignore_errors=True)
+        shutil.rmtree(self.download_cache_dir, ignore_errors=True)
+
     def test_init(self):
         """Test PackageAnalyzer initialization."""
         analyzer = PackageAnalyzer()
@@ -163,10 +183,16 @@ class TestPackageAnalyzer(unittest.TestCase):
         self.assertEqual(len(result.versions), 2)
         self.assertEqual(mock_analyze_version.call_count, 2)
 
+    def test_analyze_package_versions_param_conflict(self):
+        """Test that versions cannot be combined with range parameters."""
+        with self.assertRaises(ValueError) as context:
+            self.analyzer.analyze_package(
+                "test-package", versions=["1.0.0"], max_versions=1
+            )
+        self.assertRegex(str(context.exception), CONFLICT_MESSAGE_RE)
+
     def test_compare_versions(self):
-        """Test version comparison functionality by using analyze_package directly."""
-        # Since compare_versions method doesn't exist, test the analyze_package method
-        # with specific versions instead
+        """Test comparing two specific versions of a package."""
         mock_result = AnalysisResult(
             package_name="test-package",
             versions=[self.version1, self.version2],
@@ -174,15 +200,67 @@ class TestPackageAnalyzer(unittest.TestCase):
             changes=[],
         )
 
-        with patch.object(self.analyzer, "analyze_package", return_value=mock_result):
-            result = self.analyzer.analyze_package(
-                "test-package", versions=["1.0.0", "1.1.0"]
-            )
+        with patch.object(
+            self.analyzer, "analyze_package", return_value=mock_result
+        ) as mock_analyze:
+            result = self.analyzer.compare_versions("test-package", "1.0.0", "1.1.0")
 
-        # Verify result structure
+        # Verify result structure and that the right versions were analyzed
         self.assertIsInstance(result, AnalysisResult)
         self.assertEqual(result.package_name, "test-package")
         self.assertEqual(len(result.versions), 2)
+        mock_analyze.assert_called_once_with(
+            "test-package", versions=["1.0.0", "1.1.0"]
+        )
+
+    def test_compare_versions_memoized(self):
+        """Test that compare_versions memoizes results per version pair."""
+        mock_result = AnalysisResult(
+            package_name="test-package",
+            versions=[self.version1, self.version2],
+            api_elements={"1.0.0": [self.api1], "1.1.0": [self.api1, self.api2]},
+            changes=[],
+        )
+
+        with patch.object(
+            self.analyzer, "analyze_package", return_value=mock_result
+        ) as mock_analyze:
+            first = self.analyzer.compare_versions("test-package", "1.0.0", "1.1.0")
+            second = self.analyzer.compare_versions("test-package", "1.0.0", "1.1.0")
+
+        # Same cached object, only one underlying analysis
+        self.assertIs(first, second)
+        mock_analyze.assert_called_once_with(
+            "test-package", versions=["1.0.0", "1.1.0"]
+        )
+
+        # clear_cache forces a fresh analysis
+        self.analyzer.clear_cache()
+        with patch.object(
+            self.analyzer, "analyze_package", return_value=mock_result
+        ) as mock_analyze:
+            self.analyzer.compare_versions("test-package", "1.0.0", "1.1.0")
+        mock_analyze.assert_called_once()
+
+    @patch("pypevol.analyzer.PackageAnalyzer._analyze_version")
+    def test_intent_cache_shared_across_entry_points(self, mock_analyze_version):
+        """Test that equivalent requests via different entry points share one cache entry."""
+        mock_analyze_version.return_value = [self.api1]
+        self.analyzer.fetcher.get_specific_versions = Mock(
+            return_value=[self.version1, self.version2]
+        )
+
+        first = self.analyzer.analyze_package(
+            "test-package", versions=["1.0.0", "1.1.0"]
+        )
+        second = self.analyzer.compare_versions("test-package", "1.0.0", "1.1.0")
+        third = self.analyzer.compare_versions("test-package", "1.1.0", "1.0.0")
+
+        # Both comparisons are cache hits on the first analysis
+        self.assertIs(second, first)
+        self.assertIs(third, first)
+        self.assertEqual(self.analyzer.fetcher.get_specific_versions.call_count, 1)
+        self.assertEqual(mock_analyze_version.call_count, 2)
 
     def test_calculate_changes_added(self):
         """Test API change calculation for added APIs."""
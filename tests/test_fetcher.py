@@ -0,0 +1,104 @@
+"""Tests for PyPIFetcher."""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import requests
+
+from pypevol.fetcher import PyPIFetcher, _parse_upload_time
+
+
+class TestPyPIFetcher(unittest.TestCase):
+    """Test PyPIFetcher class."""
+
+    def setUp(self):
+        """Set up a fetcher with no download cache."""
+        self.fetcher = PyPIFetcher()
+
+    def test_shared_session(self):
+        """Test that all fetcher instances reuse one session."""
+        other = PyPIFetcher()
+        self.assertIs(self.fetcher.session, other.session)
+
+    def test_get_packages_metadata(self):
+        """Test concurrent metadata fetch for several packages."""
+
+        def mock_get_metadata(package_name, use_cache=True):
+            if package_name == "missing":
+                raise requests.RequestException("not found")
+            return {"info": {"name": package_name}}
+
+        self.fetcher.get_package_metadata = Mock(side_effect=mock_get_metadata)
+
+        results = self.fetcher.get_packages_metadata(["requests", "missing", "flask"])
+
+        self.assertEqual(set(results), {"requests", "flask"})
+        self.assertEqual(results["flask"]["info"]["name"], "flask")
+        self.assertEqual(self.fetcher.get_package_metadata.call_count, 3)
+
+    def test_metadata_disk_cache(self):
+        """Test that metadata served from the disk cache skips the network."""
+        metadata = {"info": {"name": "demo"}, "releases": {}}
+        response = Mock()
+        response.content = b'{"info": {"name": "demo"}, "releases": {}}'
+        response.json.return_value = metadata
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch.dict(os.environ, {"PYPEVOL_CACHE": temp_dir}):
+                self.fetcher.session = Mock()
+                self.fetcher.session.get.return_value = response
+                first = self.fetcher.get_package_metadata("demo")
+
+                # A fresh fetcher has a cold in-memory cache, so a hit here
+                # can only come from disk
+                other = PyPIFetcher()
+                other.session = Mock()
+                second = other.get_package_metadata("demo")
+
+        self.assertEqual(first, metadata)
+        self.assertEqual(second, metadata)
+        other.session.get.assert_not_called()
+
+    def test_get_latest_versions(self):
+        """Test selecting the most recent versions from the sorted index."""
+        releases = {"1.0.0": [], "1.10.0": [], "1.2.0": [], "not a version": []}
+        self.fetcher.get_all_releases = Mock(return_value=releases)
+
+        self.assertEqual(
+            self.fetcher.get_latest_versions("demo", 2), ["1.10.0", "1.2.0"]
+        )
+        self.assertEqual(self.fetcher.get_latest_versions("demo", 0), [])
+
+    def test_session_pool_configuration(self):
+        """Test that the session pools connections and retries transient errors."""
+        adapter = self.fetcher.session.get_adapter("https://pypi.org")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+
+class TestParseUploadTime(unittest.TestCase):
+    """Test the upload-time parsing helper."""
+
+    def test_iso_8601_with_z_suffix(self):
+        """Test parsing PyPI's upload_time_iso_8601 format."""
+        parsed = _parse_upload_time("2023-01-01T12:00:00.000000Z")
+        self.assertEqual(parsed, datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc))
+
+    def test_legacy_upload_time(self):
+        """Test parsing the legacy space-separated upload_time format."""
+        parsed = _parse_upload_time("2023-01-01 12:00:00")
+        self.assertEqual(parsed, datetime(2023, 1, 1, 12, 0, 0))
+
+    def test_invalid_or_missing(self):
+        """Test that missing or malformed timestamps return None."""
+        self.assertIsNone(_parse_upload_time(None))
+        self.assertIsNone(_parse_upload_time(""))
+        self.assertIsNone(_parse_upload_time("not-a-date"))
+
+
+if __name__ == "__main__":
+    unittest.main()
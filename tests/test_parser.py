@@ -0,0 +1,67 @@
+"""Tests for SourceParser."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from pypevol.parser import SourceParser
+
+
+class TestSourceParser(unittest.TestCase):
+    """Test SourceParser class."""
+
+    def setUp(self):
+        """Set up a parser with default options."""
+        self.parser = SourceParser()
+
+    def test_parse_file(self):
+        """Test parsing a single file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / "module.py"
+            file_path.write_text(
+                "def public_function(arg: int) -> str:\n"
+                '    """A public function."""\n'
+                "    return str(arg)\n"
+            )
+
+            elements = self.parser.parse_file(file_path, "pkg.module")
+
+        self.assertEqual(len(elements), 1)
+        self.assertEqual(elements[0].name, "public_function")
+        self.assertEqual(elements[0].module_path, "pkg.module")
+
+    def test_parse_source(self):
+        """Test parsing source held in memory."""
+        code = (
+            "class PublicClass:\n"
+            '    """A public class."""\n'
+            "\n"
+            "    def method(self):\n"
+            "        pass\n"
+        )
+
+        elements = self.parser.parse_source(code, "test.module")
+
+        names = {element.name for element in elements}
+        self.assertEqual(names, {"PublicClass", "method"})
+
+    def test_parse_package_parallel(self):
+        """Test that large packages parse the same as small ones."""
+        file_count = SourceParser.PARALLEL_PARSE_THRESHOLD + 2
+        with tempfile.TemporaryDirectory() as temp_dir:
+            package_path = Path(temp_dir) / "pkg"
+            package_path.mkdir()
+            (package_path / "__init__.py").write_text("")
+            for i in range(file_count):
+                (package_path / f"module{i}.py").write_text(
+                    f"def function{i}():\n    pass\n"
+                )
+
+            elements = self.parser.parse_package(package_path, "pkg")
+
+        names = {element.name for element in elements}
+        self.assertEqual(names, {f"function{i}" for i in range(file_count)})
+
+
+if __name__ == "__main__":
+    unittest.main()
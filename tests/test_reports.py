@@ -0,0 +1,224 @@
+"""Tests for ReportGenerator."""
+
+import io
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from pypevol.models import (
+    AnalysisResult,
+    APIChange,
+    APIElement,
+    APIType,
+    ChangeType,
+    VersionInfo,
+)
+from pypevol.reports import ReportGenerator
+
+
+def make_result_data():
+    """Build a small analysis result dictionary for report tests."""
+    return {
+        "package_name": "test-package",
+        "summary": {
+            "total_versions": 2,
+            "total_changes": 2,
+            "changes_by_type": {"added": 1, "removed": 1},
+            "apis_by_type": {"function": 2},
+        },
+        "versions": [
+            {"version": "1.0.0", "release_date": "2023-01-01T00:00:00"},
+            {"version": "1.1.0", "release_date": "2023-02-01T00:00:00"},
+        ],
+        "changes": [
+            {
+                "change_type": "added",
+                "to_version": "1.1.0",
+                "description": "Added function1",
+                "element": {
+                    "name": "function1",
+                    "full_name": "pkg.function1",
+                    "type": "function",
+                    "module_path": "pkg",
+                },
+            },
+            {
+                "change_type": "removed",
+                "to_version": "1.1.0",
+                "description": "Removed function0",
+                "old_signature": "function0()",
+                "element": {
+                    "name": "function0",
+                    "full_name": "pkg.function0",
+                    "type": "function",
+                    "module_path": "pkg",
+                },
+            },
+        ],
+        "api_elements": {
+            "1.0.0": [{"name": "function0", "full_name": "pkg.function0"}],
+            "1.1.0": [{"name": "function1", "full_name": "pkg.function1"}],
+        },
+    }
+
+
+class TestReportGenerator(unittest.TestCase):
+    """Test ReportGenerator class."""
+
+    def setUp(self):
+        """Set up a generator and a small result fixture."""
+        self.generator = ReportGenerator()
+        self.result_data = make_result_data()
+
+    def test_generate_json_report(self):
+        """Test that the JSON report round-trips through json.loads."""
+        content = self.generator.generate_single_package_report(
+            self.result_data, "json"
+        )
+
+        parsed = json.loads(content)
+        self.assertEqual(parsed["package_name"], "test-package")
+        self.assertEqual(len(parsed["changes"]), 2)
+        self.assertEqual(parsed["summary"]["total_changes"], 2)
+
+    def test_custom_template_rendering(self):
+        """Test rendering a report through a custom template."""
+        template = (
+            "<h1>{{ package_name }}</h1>" "<p>{{ summary.total_changes }} changes</p>"
+        )
+        content = self.generator.generate_single_package_report(
+            self.result_data, "html", template=template
+        )
+
+        self.assertIn("<h1>test-package</h1>", content)
+        self.assertIn("2 changes", content)
+
+    def test_generate_csv_report(self):
+        """Test that the CSV report has a header row and one row per change."""
+        content = self.generator.generate_single_package_report(self.result_data, "csv")
+
+        lines = content.splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("Version,Change Type,API Type"))
+        self.assertIn("function1", lines[1])
+        self.assertIn("function0()", lines[2])
+
+    def test_html_report_escapes_content(self):
+        """Test that user-controlled strings are escaped in HTML output."""
+        self.result_data["changes"][0]["description"] = "<script>alert(1)</script>"
+        content = self.generator.generate_single_package_report(
+            self.result_data, "html"
+        )
+
+        self.assertNotIn("<script>alert(1)</script>", content)
+        self.assertIn("&lt;script&gt;alert(1)&lt;/script&gt;", content)
+
+    def test_save_report_auto_format(self):
+        """Test saving a report with the format inferred from the filename."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.generator.save_report(
+                self.result_data, Path(temp_dir) / "report.json"
+            )
+            with open(path, "r", encoding="utf-8") as f:
+                parsed = json.load(f)
+
+        self.assertEqual(parsed["package_name"], "test-package")
+
+    def test_save_report_to_stream(self):
+        """Test writing a report to an in-memory stream."""
+        buffer = io.BytesIO()
+        self.generator.save_report_to_stream(self.result_data, buffer, "json")
+
+        parsed = json.loads(buffer.getvalue())
+        self.assertEqual(parsed["package_name"], "test-package")
+
+    def test_get_format_from_filename(self):
+        """Test filename extension to format mapping."""
+        self.assertEqual(self.generator._get_format_from_filename("r.html"), "html")
+        self.assertEqual(self.generator._get_format_from_filename("r.md"), "markdown")
+        self.assertEqual(self.generator._get_format_from_filename("r.CSV"), "csv")
+        self.assertEqual(self.generator._get_format_from_filename("report"), "json")
+
+    def test_simple_template_missing_variable(self):
+        """Test that simple templates blank out missing variables."""
+        template = "<h1>{{ package_name }}</h1><p>{{ missing_variable }}</p>"
+        content = self.generator.generate_single_package_report(
+            self.result_data, "html", template=template
+        )
+
+        self.assertIn("<h1>test-package</h1>", content)
+        self.assertIn("<p></p>", content)
+
+    def test_generate_markdown_report(self):
+        """Test the Markdown report structure and change table."""
+        content = self.generator.generate_single_package_report(
+            self.result_data, "markdown"
+        )
+
+        self.assertIn("# API Evolution Report: test-package", content)
+        self.assertIn("## Summary", content)
+        self.assertIn("| 1.1.0 | ADDED | `pkg.function1` | Added function1 |", content)
+        self.assertIn("- **1.0.0** (2023-01-01)", content)
+
+    def test_empty_result_reports(self):
+        """Test that empty results still produce well-formed reports."""
+        empty = {
+            "package_name": "empty-package",
+            "summary": {},
+            "versions": [],
+            "changes": [],
+            "api_elements": {},
+        }
+
+        for format_type in ("html", "markdown", "csv"):
+            content = self.generator.generate_single_package_report(empty, format_type)
+            self.assertIn(
+                "empty-package" if format_type != "csv" else "Version",
+                content,
+            )
+
+    def test_report_from_analysis_result_dict(self):
+        """Test every format against a real AnalysisResult.to_dict payload.
+
+        The changes in that payload are emitted in compact element_ref form
+        because their elements are listed in api_elements; the generators
+        must still find the element identity fields.
+        """
+        element = APIElement(
+            name="real_function",
+            type=APIType.FUNCTION,
+            module_path="pkg",
+            signature="real_function()",
+        )
+        result = AnalysisResult(
+            package_name="real-package",
+            versions=[VersionInfo(version="1.0.0", release_date=datetime(2023, 1, 1))],
+            api_elements={"1.0.0": [element]},
+            changes=[
+                APIChange(
+                    element=element,
+                    change_type=ChangeType.ADDED,
+                    to_version="1.0.0",
+                )
+            ],
+        )
+
+        result_data = result.to_dict()
+        for format_type in ("html", "markdown", "csv", "json"):
+            content = self.generator.generate_single_package_report(
+                result_data, format_type
+            )
+            self.assertIn("real_function", content)
+            self.assertIn("real-package" if format_type != "csv" else "added", content)
+
+    def test_unsupported_format(self):
+        """Test that unknown formats raise ValueError."""
+        with self.assertRaises(ValueError) as context:
+            self.generator.generate_single_package_report(self.result_data, "pdf")
+        self.assertIn("Unsupported format", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()